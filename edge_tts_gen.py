@@ -4,6 +4,7 @@ import logging
 import re
 import uuid
 from dataclasses import dataclass
+from functools import partial
 from os.path import dirname, join
 
 from aqt import mw, qt
@@ -37,11 +38,19 @@ logger = get_logger(__name__)
 
 CREATE_NEW_FIELD_OPTION = "[ + Create new field... ]"
 PREVIEW_NOTE_SNIPPET_MAX_LENGTH = 50  # Maximum length for note snippet in preview dropdown
-TAG_RE = re.compile(r"(<!--.*?-->|<[^>]*>)")
-ENTITY_RE = re.compile(r"(&[^;]+;)")
-BRACKET_READING_RE = re.compile(r" ?\S*?\[(.*?)\]")
-BRACKET_CONTENT_RE = re.compile(r"\[.*?\]")
-WHITESPACE_RE = re.compile(" ")
+# HTML comments, tags and entities are stripped together in a single pass. The comment branch is written as an
+# unrolled loop ("[^-]*" runs separated by dashes not starting "->") so it needs no lazy backtracking and, unlike
+# "<!--.*?-->", also removes comments that span lines.
+MARKUP_RE = re.compile(r"<!--[^-]*(?:-(?!->)[^-]*)*-->|<[^>]*>|&[^;]+;")
+# Negated character classes keep the bracket patterns linear (no lazy-quantifier backtracking) while matching
+# exactly what the previous " ?\S*?\[(.*?)\]" and "\[.*?\]" forms did, including not crossing newlines.
+BRACKET_READING_RE = re.compile(r" ?[^\s\[]*\[([^\]\n]*)\]")
+BRACKET_CONTENT_RE = re.compile(r"\[[^\]\n]*\]")
+# printf-style specs for the signed prosody strings edge-tts expects (e.g. "+10Hz", "-5%")
+PITCH_FORMAT = "%+dHz"
+PERCENT_FORMAT = "%+d%%"
+# Languages written without spaces between words, so spaces are stripped before synthesis
+NO_SPACE_LANGUAGES = frozenset({"ja", "zh"})
 
 
 # Session state for confirmation dialogs
@@ -67,9 +76,9 @@ class BatchAudioResult:
 
 
 def getCommonFields(selected_notes):
-    common_fields = set()
-
-    first = True
+    common_fields = None
+    # Notes sharing a note type yield identical field sets, so intersect each note type only once
+    seen_mids = set()
 
     for note_id in selected_notes:
         note = mw.col.get_note(note_id)
@@ -77,22 +86,88 @@ def getCommonFields(selected_notes):
             raise Exception(
                 f"Note with id {note_id} is None.\nSelected note IDs: {', '.join(str(nid) for nid in selected_notes)}.\nPlease submit an issue with more information about what cards caused this at https://github.com/nia-the-cat/edge-tts-generate/issues/new"
             )
+        if note.mid in seen_mids:
+            continue
+        seen_mids.add(note.mid)
+
         model = note.note_type()
         model_fields = {f["name"] for f in model["flds"]}
-        if first:
+        if common_fields is None:
             common_fields = model_fields  # Take the first one as is and we will intersect it with the following ones
         else:
-            common_fields = common_fields.intersection(
-                model_fields
-            )  # Find the common fields by intersecting the set of all fields together
-        first = False
-    return common_fields
+            # set intersection iterates the smaller operand, so the shrinking running set keeps this cheap
+            common_fields.intersection_update(model_fields)
+        if not common_fields:
+            break  # No later note type can add fields back to an empty intersection
+
+    return common_fields if common_fields is not None else set()
+
+
+def _should_strip_whitespace(voice: str) -> bool:
+    """Only strip spaces for languages that don't rely on them."""
+    if not voice:
+        return False
+    return voice.partition("-")[0].lower() in NO_SPACE_LANGUAGES
+
+
+def _clean_note_text(note_text: str, ignore_brackets: bool, strip_whitespace: bool) -> str:
+    """Turn raw field content into the text sent for synthesis."""
+    # Remove HTML comments, tags and entities in a single pass
+    note_text = MARKUP_RE.sub("", note_text)
+
+    # Both bracket passes are no-ops without a "[", which a plain substring scan detects far faster than the regexes
+    if "[" in note_text:
+        # Replace text with reading from brackets (e.g., word[reading] -> reading)
+        note_text = BRACKET_READING_RE.sub(r"\1", note_text)
+        # Remove stuff between brackets (commonly used for readings, pitch accent, or metadata)
+        if ignore_brackets:
+            note_text = BRACKET_CONTENT_RE.sub("", note_text)
+
+    # Strip spaces for CJK languages that don't use spaces between words
+    if strip_whitespace:
+        note_text = note_text.replace(" ", "")
+
+    return note_text
 
 
 def getSpeakerList(config):
-    speakers = []
-    speakers.extend(config.get("speakers", []))
-    return speakers
+    return list(config.get("speakers") or ())
+
+
+def _append_audio(current_content: str, audio_field_text: str) -> str:
+    """Keep existing field content and add the new audio after it."""
+    return f"{current_content} {audio_field_text}" if current_content else audio_field_text
+
+
+def _replace_audio(current_content: str, audio_field_text: str) -> str:
+    """Replace the field content entirely with the new audio."""
+    return audio_field_text
+
+
+# How each audio handling mode writes the generated [sound:] tag into the destination field.
+# Skip mode only reaches the write step for notes whose field was empty, so it writes like overwrite.
+AUDIO_MODE_HANDLERS = {
+    "append": _append_audio,
+    "overwrite": _replace_audio,
+    "skip": _replace_audio,
+}
+
+
+def _is_create_new_field_index(destination_combo, index: int) -> bool:
+    """Whether index points at the "Create new field" entry, which is always kept last in the dropdown."""
+    return index >= 0 and index == destination_combo.count() - 1
+
+
+def _preview_note_index(combo_index: int, note_count: int) -> int:
+    """Clamp the preview combo selection to a valid note index, falling back to the first note."""
+    return combo_index if 0 <= combo_index < note_count else 0
+
+
+def _note_snippet(note_text: str, max_length: int = PREVIEW_NOTE_SNIPPET_MAX_LENGTH) -> str:
+    """Shorten note text for the preview dropdown; short text is returned as-is without slicing."""
+    if len(note_text) <= max_length:
+        return note_text
+    return note_text[:max_length] + "..."
 
 
 def getSpeaker(speaker_combo):
@@ -260,15 +335,8 @@ class AudioGenDialog(qt.QDialog):
 
         if self.speaker_combo.count() > 0:
             # find the speaker/style from the previously saved config data and pick it from the dropdown
-            speaker_combo_index = 0
-            i = 0
-            for speaker_item in [self.speaker_combo.itemText(i) for i in range(self.speaker_combo.count())]:
-                if speaker_item == last_speaker_name:
-                    speaker_combo_index = i
-                    break
-                i += 1
-
-            self.speaker_combo.setCurrentIndex(speaker_combo_index)
+            speaker_combo_index = self.speaker_combo.findText(last_speaker_name) if last_speaker_name else -1
+            self.speaker_combo.setCurrentIndex(max(speaker_combo_index, 0))
             self.speaker_status_label.hide()
         else:
             self.speaker_combo.setEnabled(False)
@@ -400,14 +468,14 @@ class AudioGenDialog(qt.QDialog):
         self._preview_cache = None
 
     def _get_preview_parameters(self):
-        pitch = f"{self.pitch_slider.value():+}Hz"
-        rate = f"{self.speed_slider.value():+}%"
-        volume = f"{self.volume_slider.value():+}%"
+        pitch = PITCH_FORMAT % self.pitch_slider.value()
+        rate = PERCENT_FORMAT % self.speed_slider.value()
+        volume = PERCENT_FORMAT % self.volume_slider.value()
         return pitch, rate, volume
 
     def onDestinationChanged(self, index):
         """Handle destination field dropdown change - prompt for new field name if 'Create new field' is selected"""
-        if self.destination_combo.itemText(index) == CREATE_NEW_FIELD_OPTION:
+        if _is_create_new_field_index(self.destination_combo, index):
             # Use the tracked previous selection before showing the dialog
             previous_index = self._previous_destination_index
 
@@ -454,7 +522,7 @@ class AudioGenDialog(qt.QDialog):
             return
 
         # Don't allow selecting "Create new field" option directly without entering a name
-        if destination_text == CREATE_NEW_FIELD_OPTION:
+        if _is_create_new_field_index(self.destination_combo, self.destination_combo.currentIndex()):
             QMessageBox.critical(
                 mw,
                 "Error",
@@ -534,16 +602,12 @@ class AudioGenDialog(qt.QDialog):
             try:
                 note_text = note[source_field]
                 # Clean the text to show a snippet
-                note_text = ENTITY_RE.sub("", note_text)
-                note_text = TAG_RE.sub("", note_text)
+                note_text = MARKUP_RE.sub("", note_text)
                 note_text = note_text.strip()
 
                 # Create a short snippet using the configured max length
                 if note_text:
-                    snippet = note_text[:PREVIEW_NOTE_SNIPPET_MAX_LENGTH]
-                    if len(note_text) > PREVIEW_NOTE_SNIPPET_MAX_LENGTH:
-                        snippet += "..."
-                    self.preview_note_combo.addItem(f"Note {i + 1}: {snippet}")
+                    self.preview_note_combo.addItem(f"Note {i + 1}: {_note_snippet(note_text)}")
                 else:
                     self.preview_note_combo.addItem(f"Note {i + 1}: (empty)")
             except KeyError:
@@ -566,10 +630,7 @@ class AudioGenDialog(qt.QDialog):
         # Get the selected note index from combo box (if multiple notes)
         note_index = 0
         if len(self.selected_notes) > 1 and hasattr(self, "preview_note_combo"):
-            note_index = self.preview_note_combo.currentIndex()
-            # Ensure index is valid
-            if note_index < 0 or note_index >= len(self.selected_notes):
-                note_index = 0
+            note_index = _preview_note_index(self.preview_note_combo.currentIndex(), len(self.selected_notes))
 
         note_id = self.selected_notes[note_index]
         note = mw.col.get_note(note_id)
@@ -584,23 +645,10 @@ class AudioGenDialog(qt.QDialog):
         if not note_text:
             return None, "field_empty"
 
-        # Clean the text similar to how it's done in getNoteTextAndSpeaker
-        # Remove HTML entities and tags
-        note_text = ENTITY_RE.sub("", note_text)
-        note_text = TAG_RE.sub("", note_text)
-
-        # Replace text with reading from brackets (e.g., word[reading] -> reading)
-        note_text = BRACKET_READING_RE.sub(r"\1", note_text)
-
-        # Remove stuff between brackets if option is enabled
-        if self.ignore_brackets_checkbox.isChecked():
-            note_text = BRACKET_CONTENT_RE.sub("", note_text)
-
-        # Strip whitespace for CJK languages that don't use spaces between words
-        if speaker:
-            language_code = speaker.split("-")[0].lower()
-            if language_code in {"ja", "zh"}:
-                note_text = WHITESPACE_RE.sub("", note_text)
+        # Clean the text the same way generation does
+        note_text = _clean_note_text(
+            note_text, self.ignore_brackets_checkbox.isChecked(), _should_strip_whitespace(speaker)
+        )
 
         cleaned_text = note_text.strip() if note_text else None
         if not cleaned_text:
@@ -670,8 +718,8 @@ class AudioGenDialog(qt.QDialog):
         def on_preview_done(future):
             """Callback when preview generation is complete"""
             # Re-enable button
-            mw.taskman.run_on_main(lambda: self.preview_voice_button.setEnabled(True))
-            mw.taskman.run_on_main(lambda: self.preview_voice_button.setText(original_text))
+            mw.taskman.run_on_main(partial(self.preview_voice_button.setEnabled, True))
+            mw.taskman.run_on_main(partial(self.preview_voice_button.setText, original_text))
 
             try:
                 result = future.result()
@@ -687,15 +735,24 @@ class AudioGenDialog(qt.QDialog):
 
                 mw.taskman.run_on_main(play_preview)
             except Exception as exc:
-                error_msg = str(exc)
-                mw.taskman.run_on_main(
-                    lambda: QMessageBox.critical(self, "Preview Error", f"Failed to generate preview:\n{error_msg}")
-                )
+                message = f"Failed to generate preview:\n{exc}"
+                mw.taskman.run_on_main(partial(QMessageBox.critical, self, "Preview Error", message))
 
         # Run preview generation in background thread
         mw.taskman.run_in_background(generate_preview, on_preview_done)
 
 
+def _format_prosody(config) -> tuple[str, str, str]:
+    """Build the signed edge-tts pitch, rate and volume strings from the saved slider values."""
+    # The sliders only produce integers, but a hand-edited config.json may hold floats; "%+d" would
+    # silently truncate those, so round to the nearest whole step explicitly
+    return (
+        PITCH_FORMAT % round(config.get("pitch_slider_value", 0)),
+        PERCENT_FORMAT % round(config.get("speed_slider_value", 0)),
+        PERCENT_FORMAT % round(config.get("volume_slider_value", 0)),
+    )
+
+
 def GenerateAudioBatch(text_speaker_items, config):
     """Generate audio for a batch of text items using bundled edge-tts."""
     if not text_speaker_items:
@@ -705,9 +762,7 @@ def GenerateAudioBatch(text_speaker_items, config):
     logger.info("Starting batch audio generation for %d items", len(text_speaker_items))
 
     # Build TTS configuration from config
-    pitch = f"{config.get('pitch_slider_value', 0):+}Hz"
-    rate = f"{config.get('speed_slider_value', 0):+}%"
-    volume = f"{config.get('volume_slider_value', 0):+}%"
+    pitch, rate, volume = _format_prosody(config)
     stream_timeout_seconds = config.get("stream_timeout_seconds", 30.0)
     stream_timeout_retries = config.get("stream_timeout_retries", 1)
     # All items share the same voice; take the first entry
@@ -846,37 +901,16 @@ def onEdgeTTSOptionSelected(browser):
         config["last_destination_field"] = destination_field
         config["last_speaker_name"] = speaker_combo_text
         config["last_audio_handling"] = audio_handling_mode
-        config["ignore_brackets_enabled"] = dialog.ignore_brackets_checkbox.isChecked()
+        ignore_brackets = dialog.ignore_brackets_checkbox.isChecked()
+        config["ignore_brackets_enabled"] = ignore_brackets
         mw.addonManager.writeConfig(__name__, config)
 
+        # The voice is fixed for the whole batch, so decide on whitespace stripping once
+        strip_whitespace = _should_strip_whitespace(speaker)
+
         def getNoteTextAndSpeaker(note_id):
             note = mw.col.get_note(note_id)
-            note_text = note[source_field]
-
-            def _should_strip_whitespace(selected_voice: str) -> bool:
-                """Only strip spaces for languages that don't rely on them."""
-
-                if not selected_voice:
-                    return False
-
-                language_code = selected_voice.split("-")[0].lower()
-                return language_code in {"ja", "zh"}
-
-            # Remove HTML tags and entities using standard regex patterns
-            note_text = ENTITY_RE.sub("", note_text)
-            note_text = TAG_RE.sub("", note_text)
-
-            # Replace text with reading from brackets (e.g., word[reading] -> reading)
-            note_text = BRACKET_READING_RE.sub(r"\1", note_text)
-            # Remove stuff between brackets (commonly used for readings, pitch accent, or metadata)
-            if dialog.ignore_brackets_checkbox.isChecked():
-                note_text = BRACKET_CONTENT_RE.sub("", note_text)
-
-            if _should_strip_whitespace(speaker):
-                note_text = WHITESPACE_RE.sub(
-                    "", note_text
-                )  # Strip spaces for CJK languages that don't use spaces between words
-
+            note_text = _clean_note_text(note[source_field], ignore_brackets, strip_whitespace)
             return (note_text, speaker)
 
         def updateProgress(notes_so_far, total_notes, skipped_count=0):
@@ -927,6 +961,7 @@ def onEdgeTTSOptionSelected(browser):
             pending_note_ids = []
             chunk_size = 10
             config = mw.addonManager.getConfig(__name__)
+            apply_audio = AUDIO_MODE_HANDLERS[audio_handling_mode]
 
             for note_id in notes:
                 note = mw.col.get_note(note_id)
@@ -1012,12 +1047,7 @@ def onEdgeTTSOptionSelected(browser):
                     current_content = getFieldContent(note, destination_field)
 
                     # Handle audio placement based on mode
-                    if audio_handling_mode == "append" and current_content:
-                        # Append: keep existing content and add new audio
-                        note[destination_field] = current_content + " " + audio_field_text
-                    else:
-                        # Overwrite: replace content entirely (also used for empty fields)
-                        note[destination_field] = audio_field_text
+                    note[destination_field] = apply_audio(current_content, audio_field_text)
 
                     mw.col.update_note(note)
                     updateProgress(notes_so_far, total_notes, skipped_count)
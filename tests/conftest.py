@@ -7,8 +7,12 @@ This module provides:
 - Test configuration and markers
 """
 
+import importlib.util
+import json
+import logging
 import os
 import sys
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
@@ -31,20 +35,25 @@ def pytest_configure(config):
         sys.modules[module_name] = MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config():
-    """Provide a sample configuration for testing."""
-    return {
-        "last_destination_field": "Audio",
-        "last_source_field": "Front",
-        "last_speaker_name": "en-US-JennyNeural",
-        "pitch_slider_value": 0,
-        "speakers": ["en-US-JennyNeural", "en-US-GuyNeural"],
-        "speed_slider_value": 0,
-        "volume_slider_value": 0,
-        "ignore_brackets_enabled": True,
-        "last_audio_handling": "append",
-    }
+    """Provide a read-only sample configuration shared across the session.
+
+    Tests that need to modify it should work on ``dict(sample_config)``.
+    """
+    return MappingProxyType(
+        {
+            "last_destination_field": "Audio",
+            "last_source_field": "Front",
+            "last_speaker_name": "en-US-JennyNeural",
+            "pitch_slider_value": 0,
+            "speakers": ["en-US-JennyNeural", "en-US-GuyNeural"],
+            "speed_slider_value": 0,
+            "volume_slider_value": 0,
+            "ignore_brackets_enabled": True,
+            "last_audio_handling": "append",
+        }
+    )
 
 
 @pytest.fixture
@@ -59,16 +68,150 @@ def sample_voices():
     ]
 
 
-@pytest.fixture
+_ADDON_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def pure_python_vendor_env():
+    """Run the add-on's vendor setup once, before any test imports the vendored aiohttp stack.
+
+    Like the add-on itself, this only fills in flags the developer has not already set.
+    """
+    from vendor_setup import ensure_vendor_path
+
+    ensure_vendor_path()
+
+
+@pytest.fixture(scope="session")
 def base_path():
     """Return the base path of the addon."""
-    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return _ADDON_ROOT
+
+
+def _scan_addon_dir(*parts):
+    """Map entry names in an add-on directory to their ``os.DirEntry``."""
+    with os.scandir(os.path.join(_ADDON_ROOT, *parts)) as entries:
+        return {entry.name: entry for entry in entries}
+
+
+@pytest.fixture(scope="session")
+def addon_entries():
+    """Return the add-on root's directory entries, scanned once per test session."""
+    return _scan_addon_dir()
+
+
+@pytest.fixture(scope="session")
+def vendor_entries():
+    """Return the vendor directory's entries, scanned once per test session."""
+    return _scan_addon_dir("vendor")
+
+
+def _read_addon_text(filename):
+    """Read a text file from the add-on root."""
+    path = os.path.join(_ADDON_ROOT, filename)
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _load_addon_json(filename):
+    """Parse a JSON file from the add-on root."""
+    return json.loads(_read_addon_text(filename))
+
+
+@pytest.fixture(scope="session")
+def addon_config():
+    """Return the parsed add-on config.json, read once per test session."""
+    return _load_addon_json("config.json")
+
+
+@pytest.fixture(scope="session")
+def addon_manifest():
+    """Return the parsed add-on manifest.json, read once per test session."""
+    return _load_addon_json("manifest.json")
+
+
+@pytest.fixture(scope="session")
+def init_source():
+    """Return the source of the add-on's __init__.py, read once per test session."""
+    return _read_addon_text("__init__.py")
+
+
+@pytest.fixture(scope="session")
+def requirements_test_text():
+    """Return the contents of requirements-test.txt, read once per test session."""
+    return _read_addon_text("requirements-test.txt")
+
+
+@pytest.fixture(scope="session")
+def pyproject_text():
+    """Return the contents of pyproject.toml, read once per test session."""
+    return _read_addon_text("pyproject.toml")
+
+
+@pytest.fixture(scope="session")
+def bundled_tts():
+    """Load bundled_tts once per session as the top-level ``bundled_tts`` module.
+
+    Tests that replace module attributes must do so with ``patch.object``/``monkeypatch`` so the
+    shared module is restored afterwards.
+    """
+    spec = importlib.util.spec_from_file_location("bundled_tts", os.path.join(_ADDON_ROOT, "bundled_tts.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def edge_tts_gen():
+    """Load edge_tts_gen once per session as part of a synthetic edge_tts_generate package.
+
+    Tests that replace module attributes must do so with ``patch.object``/``monkeypatch`` so the
+    shared module is restored afterwards.
+    """
+    package_name = "edge_tts_generate"
+    package = sys.modules.get(package_name)
+    if package is None:
+        package = type(sys)(package_name)
+        package.__path__ = [_ADDON_ROOT]
+        sys.modules[package_name] = package
+
+    spec = importlib.util.spec_from_file_location(
+        f"{package_name}.edge_tts_gen", os.path.join(_ADDON_ROOT, "edge_tts_gen.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_logging_config():
+    """Execute logging_config.py as a standalone module."""
+    spec = importlib.util.spec_from_file_location("logging_config", os.path.join(_ADDON_ROOT, "logging_config.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def logging_config():
+    """Load logging_config once per session for tests that only read from it."""
+    return _load_logging_config()
+
+
+def _reset_logging_state(module):
+    """Remove the add-on's log handlers and mark logging_config as unconfigured."""
+    root_logger = logging.getLogger("edge_tts_generate")
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+    root_logger.setLevel(logging.NOTSET)
+    module._state.handler_configured = False
 
 
 @pytest.fixture
-def mock_note():
-    """Provide a mock Anki note object."""
-    note = MagicMock()
-    note.__getitem__ = MagicMock(return_value="Sample text content")
-    note.note_type.return_value = {"id": 1, "flds": [{"name": "Front"}, {"name": "Back"}, {"name": "Audio"}]}
-    return note
+def isolated_logging_config(logging_config):
+    """Yield the shared logging_config with logger state reset around a test that reconfigures it."""
+    _reset_logging_state(logging_config)
+    yield logging_config
+    _reset_logging_state(logging_config)
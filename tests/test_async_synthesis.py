@@ -6,56 +6,22 @@ These tests verify the async synthesis implementation using mocks.
 
 from __future__ import annotations
 
-import importlib.util
-import os
-import sys
+import asyncio
 
 import pytest
 
 
-_BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-_MODULE_PATH = os.path.join(_BASE_PATH, "bundled_tts.py")
-
-
-def _setup_bundled_tts_env():
-    """Set up the environment for importing bundled_tts."""
-    os.environ["AIOHTTP_NO_EXTENSIONS"] = "1"
-    os.environ["FROZENLIST_NO_EXTENSIONS"] = "1"
-    os.environ["MULTIDICT_NO_EXTENSIONS"] = "1"
-    os.environ["YARL_NO_EXTENSIONS"] = "1"
-    os.environ["PROPCACHE_NO_EXTENSIONS"] = "1"
-
-    vendor_dir = os.path.join(_BASE_PATH, "vendor")
-    if vendor_dir not in sys.path:
-        sys.path.insert(0, vendor_dir)
-
-
-def _load_bundled_tts():
-    """Load the bundled_tts module."""
-    _setup_bundled_tts_env()
-
-    spec = importlib.util.spec_from_file_location("bundled_tts", _MODULE_PATH)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["bundled_tts"] = module
-    spec.loader.exec_module(module)
-    return module
-
-
 class TestSynthesizeBatchConcurrency:
     """Test batch synthesis concurrency control."""
 
-    def test_batch_concurrency_limit_is_respected(self):
+    def test_batch_concurrency_limit_is_respected(self, bundled_tts):
         """Batch should respect BATCH_CONCURRENCY_LIMIT."""
-        bundled_tts = _load_bundled_tts()
-
         # Verify the constant exists and is reasonable
         assert bundled_tts.BATCH_CONCURRENCY_LIMIT > 0
         assert bundled_tts.BATCH_CONCURRENCY_LIMIT <= 10
 
-    def test_batch_processes_multiple_items(self):
+    def test_batch_processes_multiple_items(self, bundled_tts):
         """synthesize_batch should handle multiple items."""
-        bundled_tts = _load_bundled_tts()
-
         # Verify we can create multiple items
         items = [
             bundled_tts.TTSItem(identifier="1", text="First"),
@@ -71,41 +37,30 @@ class TestSynthesizeBatchConcurrency:
 class TestBatchResultOrdering:
     """Test that batch synthesis results preserve input order."""
 
-    def test_asyncio_gather_preserves_order(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_asyncio_gather_preserves_order(self):
         """asyncio.gather should preserve the order of results.
 
         This test verifies the fundamental behavior that allows
         us to preserve input order in batch synthesis.
         """
-        import asyncio
 
         async def make_result(value: int) -> int:
             # Simulate variable-duration work
             await asyncio.sleep(0.001 * (10 - value))  # Shorter sleep for larger values
             return value
 
-        async def run_test():
-            tasks = [make_result(i) for i in [5, 2, 8, 1, 9, 3]]
-            results = await asyncio.gather(*tasks)
-            return results
-
-        loop = asyncio.new_event_loop()
-        try:
-            results = loop.run_until_complete(run_test())
-        finally:
-            loop.close()
+        results = await asyncio.gather(*(make_result(i) for i in [5, 2, 8, 1, 9, 3]))
 
         # Results should be in the same order as the input, not completion order
         assert results == [5, 2, 8, 1, 9, 3]
 
-    def test_results_maintain_input_order_with_numeric_identifiers(self):
+    def test_results_maintain_input_order_with_numeric_identifiers(self, bundled_tts):
         """Results should match input order even with numeric-like identifiers.
 
         This ensures that input order is preserved, not reordered by sorting.
         For example: ["9", "1", "10"] stays as ["9", "1", "10"], not sorted to ["1", "10", "9"].
         """
-        bundled_tts = _load_bundled_tts()
-
         # Create items with identifiers that would be reordered if sorted lexicographically
         # Input order: ["9", "1", "10"]
         # Lexicographic sort would produce: ["1", "10", "9"] (since "10" < "9")
@@ -128,10 +83,8 @@ class TestBatchResultOrdering:
 class TestSynthesizeBatchErrorHandling:
     """Test error handling in batch synthesis."""
 
-    def test_partial_failure_returns_mixed_results(self):
+    def test_partial_failure_returns_mixed_results(self, bundled_tts):
         """Batch should return both successes and failures."""
-        bundled_tts = _load_bundled_tts()
-
         # Simulate mixed results
         results = [
             bundled_tts.TTSResult(identifier="1", audio=b"success"),
@@ -145,10 +98,8 @@ class TestSynthesizeBatchErrorHandling:
         assert len(successes) == 2
         assert len(failures) == 1
 
-    def test_all_failures_returns_all_errors(self):
+    def test_all_failures_returns_all_errors(self, bundled_tts):
         """Batch should return all errors if all fail."""
-        bundled_tts = _load_bundled_tts()
-
         results = [
             bundled_tts.TTSResult(identifier="1", error="Failed 1"),
             bundled_tts.TTSResult(identifier="2", error="Failed 2"),
@@ -161,10 +112,8 @@ class TestSynthesizeBatchErrorHandling:
 class TestSynthesizeBatchWithVoiceOverride:
     """Test voice override functionality in batch synthesis."""
 
-    def test_item_voice_override_creates_correct_config(self):
+    def test_item_voice_override_creates_correct_config(self, bundled_tts):
         """Items with voice override should use their own voice."""
-        bundled_tts = _load_bundled_tts()
-
         # Verify config merging logic
         base_config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
@@ -188,10 +137,8 @@ class TestSynthesizeBatchWithVoiceOverride:
         assert item_config.voice == "ja-JP-NanamiNeural"
         assert item_config.pitch == "+0Hz"
 
-    def test_item_without_voice_uses_config_voice(self):
+    def test_item_without_voice_uses_config_voice(self, bundled_tts):
         """Items without voice override should use config voice."""
-        bundled_tts = _load_bundled_tts()
-
         base_config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="+0Hz",
@@ -214,10 +161,8 @@ class TestSynthesizeBatchWithVoiceOverride:
 class TestTimeoutHandling:
     """Test timeout configuration and handling."""
 
-    def test_timeout_values_are_passed_correctly(self):
+    def test_timeout_values_are_passed_correctly(self, bundled_tts):
         """Timeout values should be passed to config."""
-        bundled_tts = _load_bundled_tts()
-
         config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="+0Hz",
@@ -230,10 +175,8 @@ class TestTimeoutHandling:
         assert config.stream_timeout == 45.0
         assert config.stream_timeout_retries == 2
 
-    def test_default_timeout_values(self):
+    def test_default_timeout_values(self, bundled_tts):
         """Default timeout values should be used when not specified."""
-        bundled_tts = _load_bundled_tts()
-
         config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="+0Hz",
@@ -244,10 +187,8 @@ class TestTimeoutHandling:
         assert config.stream_timeout == bundled_tts.STREAM_TIMEOUT_SECONDS_DEFAULT
         assert config.stream_timeout_retries == bundled_tts.STREAM_TIMEOUT_RETRIES_DEFAULT
 
-    def test_retry_logic_constants(self):
+    def test_retry_logic_constants(self, bundled_tts):
         """Retry-related constants should be properly defined."""
-        bundled_tts = _load_bundled_tts()
-
         # Verify retry defaults are reasonable
         assert bundled_tts.STREAM_TIMEOUT_RETRIES_DEFAULT >= 0
         assert bundled_tts.STREAM_TIMEOUT_RETRIES_DEFAULT <= 5
@@ -260,61 +201,38 @@ class TestAsyncioTimeoutRetry:
     asyncio.TimeoutError in Python 3.9-3.10, which would bypass retry logic.
     """
 
-    def test_asyncio_timeout_error_is_caught_for_retry(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_asyncio_timeout_error_is_caught_for_retry(self):
         """asyncio.TimeoutError should be caught and trigger retry."""
-        import asyncio
-
-        _load_bundled_tts()
-
         # In Python 3.9-3.10, asyncio.TimeoutError is distinct from TimeoutError
         # In Python 3.11+, they are the same
         # Our code should catch asyncio.TimeoutError specifically
         caught = False
 
-        async def timeout_test():
-            nonlocal caught
-            try:
-                await asyncio.wait_for(asyncio.sleep(10), timeout=0.001)
-            except asyncio.TimeoutError:
-                caught = True
-
-        loop = asyncio.new_event_loop()
         try:
-            loop.run_until_complete(timeout_test())
-        finally:
-            loop.close()
+            await asyncio.wait_for(asyncio.sleep(10), timeout=0.001)
+        except asyncio.TimeoutError:
+            caught = True
 
         assert caught, "asyncio.TimeoutError should be caught"
 
-    def test_wait_for_raises_asyncio_timeout_error(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_wait_for_raises_asyncio_timeout_error(self):
         """asyncio.wait_for should raise asyncio.TimeoutError on timeout."""
-        import asyncio
-
-        _load_bundled_tts()
 
         async def long_task():
             await asyncio.sleep(10)
 
-        async def test():
-            with pytest.raises(asyncio.TimeoutError):
-                await asyncio.wait_for(long_task(), timeout=0.001)
-
-        loop = asyncio.new_event_loop()
-        try:
-            loop.run_until_complete(test())
-        finally:
-            loop.close()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(long_task(), timeout=0.001)
 
-    def test_retry_loop_catches_asyncio_timeout_error(self):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_retry_loop_catches_asyncio_timeout_error(self):
         """Retry loop should catch asyncio.TimeoutError and retry.
 
         This test simulates the retry logic in _synthesize_text to verify
         that asyncio.TimeoutError is properly caught.
         """
-        import asyncio
-
-        _load_bundled_tts()
-
         attempt_count = 0
         max_retries = 2
 
@@ -333,12 +251,8 @@ class TestAsyncioTimeoutRetry:
                         raise RuntimeError("All retries exhausted") from exc
             return "unreachable"
 
-        loop = asyncio.new_event_loop()
-        try:
-            with pytest.raises(RuntimeError, match="All retries exhausted"):
-                loop.run_until_complete(test_retry())
-        finally:
-            loop.close()
+        with pytest.raises(RuntimeError, match="All retries exhausted"):
+            await test_retry()
 
         # Should have attempted max_retries + 1 times
         assert attempt_count == max_retries + 1
@@ -347,10 +261,8 @@ class TestAsyncioTimeoutRetry:
 class TestEventLoopHandling:
     """Test event loop creation and management."""
 
-    def test_synthesize_batch_uses_new_event_loop(self):
+    def test_synthesize_batch_uses_new_event_loop(self, bundled_tts):
         """synthesize_batch should create and close its own event loop."""
-        bundled_tts = _load_bundled_tts()
-
         # Verify the function signature expects items and config parameters
         assert callable(bundled_tts.synthesize_batch)
 
@@ -358,17 +270,13 @@ class TestEventLoopHandling:
 class TestItemVoiceField:
     """Test TTSItem voice field behavior."""
 
-    def test_item_voice_is_optional(self):
+    def test_item_voice_is_optional(self, bundled_tts):
         """TTSItem voice field should be optional."""
-        bundled_tts = _load_bundled_tts()
-
         item = bundled_tts.TTSItem(identifier="1", text="Hello")
         assert item.voice is None
 
-    def test_item_voice_can_be_set(self):
+    def test_item_voice_can_be_set(self, bundled_tts):
         """TTSItem voice can be set to override default."""
-        bundled_tts = _load_bundled_tts()
-
         item = bundled_tts.TTSItem(
             identifier="1",
             text="Hello",
@@ -378,8 +286,6 @@ class TestItemVoiceField:
 
     def test_item_voice_override_takes_precedence(self):
         """Item voice should take precedence over config voice."""
-        _load_bundled_tts()  # Ensure module is loaded
-
         config_voice = "en-US-JennyNeural"
         item_voice = "fr-FR-DeniseNeural"
 
@@ -392,32 +298,22 @@ class TestItemVoiceField:
 class TestEventLoopShutdown:
     """Test event loop shutdown functionality for proper cleanup."""
 
-    def test_shutdown_loop_function_exists(self):
+    def test_shutdown_loop_function_exists(self, bundled_tts):
         """_shutdown_loop function should be available."""
-        bundled_tts = _load_bundled_tts()
-
         # The function is module-private but should exist
         assert hasattr(bundled_tts, "_shutdown_loop")
         assert callable(bundled_tts._shutdown_loop)
 
-    def test_shutdown_loop_closes_loop(self):
+    def test_shutdown_loop_closes_loop(self, bundled_tts):
         """_shutdown_loop should close the event loop."""
-        import asyncio
-
-        bundled_tts = _load_bundled_tts()
-
         loop = asyncio.new_event_loop()
         assert not loop.is_closed()
 
         bundled_tts._shutdown_loop(loop)
         assert loop.is_closed()
 
-    def test_shutdown_loop_handles_pending_tasks(self):
+    def test_shutdown_loop_handles_pending_tasks(self, bundled_tts):
         """_shutdown_loop should cancel pending tasks gracefully."""
-        import asyncio
-
-        bundled_tts = _load_bundled_tts()
-
         loop = asyncio.new_event_loop()
 
         # Create a pending task on the new loop
@@ -436,24 +332,16 @@ class TestEventLoopShutdown:
         assert loop.is_closed()
         assert task.cancelled()
 
-    def test_shutdown_loop_handles_empty_loop(self):
+    def test_shutdown_loop_handles_empty_loop(self, bundled_tts):
         """_shutdown_loop should handle loop with no tasks."""
-        import asyncio
-
-        bundled_tts = _load_bundled_tts()
-
         loop = asyncio.new_event_loop()
 
         # Shutdown with no tasks should work
         bundled_tts._shutdown_loop(loop)
         assert loop.is_closed()
 
-    def test_shutdown_loop_handles_completed_tasks(self):
+    def test_shutdown_loop_handles_completed_tasks(self, bundled_tts):
         """_shutdown_loop should handle loop with completed tasks."""
-        import asyncio
-
-        bundled_tts = _load_bundled_tts()
-
         loop = asyncio.new_event_loop()
 
         async def quick_task():
@@ -10,70 +10,47 @@ These tests cover:
 from __future__ import annotations
 
 import base64
-import importlib.util
 import os
-import sys
 
+import pytest
 
-_BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-_MODULE_PATH = os.path.join(_BASE_PATH, "bundled_tts.py")
-
-
-def _setup_bundled_tts_env():
-    """Set up the environment for importing bundled_tts."""
-    # Force pure Python mode for all packages
-    os.environ["AIOHTTP_NO_EXTENSIONS"] = "1"
-    os.environ["FROZENLIST_NO_EXTENSIONS"] = "1"
-    os.environ["MULTIDICT_NO_EXTENSIONS"] = "1"
-    os.environ["YARL_NO_EXTENSIONS"] = "1"
-    os.environ["PROPCACHE_NO_EXTENSIONS"] = "1"
-
-    # Add vendor directory to sys.path
-    vendor_dir = os.path.join(_BASE_PATH, "vendor")
-    if vendor_dir not in sys.path:
-        sys.path.insert(0, vendor_dir)
-
-
-def _load_bundled_tts():
-    """Load the bundled_tts module."""
-    _setup_bundled_tts_env()
-
-    spec = importlib.util.spec_from_file_location("bundled_tts", _MODULE_PATH)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["bundled_tts"] = module
-    spec.loader.exec_module(module)
-    return module
+import vendor_setup
 
 
 class TestModuleConstants:
     """Test module constants and configuration values."""
 
-    def test_batch_concurrency_limit_is_sensible(self):
+    def test_batch_concurrency_limit_is_sensible(self, bundled_tts):
         """Batch concurrency limit should be reasonable."""
-        bundled_tts = _load_bundled_tts()
         assert bundled_tts.BATCH_CONCURRENCY_LIMIT >= 1
         assert bundled_tts.BATCH_CONCURRENCY_LIMIT <= 20
 
-    def test_stream_timeout_default_is_sensible(self):
+    def test_stream_timeout_default_is_sensible(self, bundled_tts):
         """Default stream timeout should be reasonable."""
-        bundled_tts = _load_bundled_tts()
         assert bundled_tts.STREAM_TIMEOUT_SECONDS_DEFAULT >= 10.0
         assert bundled_tts.STREAM_TIMEOUT_SECONDS_DEFAULT <= 120.0
 
-    def test_stream_timeout_retries_default_is_sensible(self):
+    def test_stream_timeout_retries_default_is_sensible(self, bundled_tts):
         """Default retry count should be reasonable."""
-        bundled_tts = _load_bundled_tts()
         assert bundled_tts.STREAM_TIMEOUT_RETRIES_DEFAULT >= 0
         assert bundled_tts.STREAM_TIMEOUT_RETRIES_DEFAULT <= 5
 
 
+@pytest.mark.integration
+class TestPublicAPI:
+    """Test that the bundled TTS module exposes the API edge_tts_gen relies on."""
+
+    @pytest.mark.parametrize("name", ["TTSConfig", "TTSItem", "TTSResult", "synthesize_batch", "synthesize_single"])
+    def test_exposes_public_name(self, bundled_tts, name):
+        """bundled_tts should define each public class and function."""
+        assert hasattr(bundled_tts, name)
+
+
 class TestTTSConfigDataclass:
     """Test TTSConfig dataclass functionality."""
 
-    def test_can_create_with_required_fields(self):
+    def test_can_create_with_required_fields(self, bundled_tts):
         """Should create TTSConfig with required fields."""
-        bundled_tts = _load_bundled_tts()
-
         config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="+0Hz",
@@ -86,10 +63,8 @@ class TestTTSConfigDataclass:
         assert config.rate == "+0%"
         assert config.volume == "+0%"
 
-    def test_has_default_stream_timeout(self):
+    def test_has_default_stream_timeout(self, bundled_tts):
         """TTSConfig should have default stream_timeout."""
-        bundled_tts = _load_bundled_tts()
-
         config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="+0Hz",
@@ -99,10 +74,8 @@ class TestTTSConfigDataclass:
 
         assert config.stream_timeout == bundled_tts.STREAM_TIMEOUT_SECONDS_DEFAULT
 
-    def test_has_default_stream_timeout_retries(self):
+    def test_has_default_stream_timeout_retries(self, bundled_tts):
         """TTSConfig should have default stream_timeout_retries."""
-        bundled_tts = _load_bundled_tts()
-
         config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="+0Hz",
@@ -112,10 +85,8 @@ class TestTTSConfigDataclass:
 
         assert config.stream_timeout_retries == bundled_tts.STREAM_TIMEOUT_RETRIES_DEFAULT
 
-    def test_can_override_defaults(self):
+    def test_can_override_defaults(self, bundled_tts):
         """Should be able to override default values."""
-        bundled_tts = _load_bundled_tts()
-
         config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="+0Hz",
@@ -132,29 +103,23 @@ class TestTTSConfigDataclass:
 class TestTTSItemDataclass:
     """Test TTSItem dataclass functionality."""
 
-    def test_can_create_with_required_fields(self):
+    def test_can_create_with_required_fields(self, bundled_tts):
         """Should create TTSItem with required fields."""
-        bundled_tts = _load_bundled_tts()
-
         item = bundled_tts.TTSItem(identifier="item-1", text="Hello world")
 
         assert item.identifier == "item-1"
         assert item.text == "Hello world"
 
-    def test_has_optional_voice_field(self):
+    def test_has_optional_voice_field(self, bundled_tts):
         """TTSItem should have optional voice field."""
-        bundled_tts = _load_bundled_tts()
-
         item = bundled_tts.TTSItem(identifier="item-1", text="Hello")
         assert item.voice is None
 
         item_with_voice = bundled_tts.TTSItem(identifier="item-2", text="Hello", voice="en-US-GuyNeural")
         assert item_with_voice.voice == "en-US-GuyNeural"
 
-    def test_identifier_can_be_any_string(self):
+    def test_identifier_can_be_any_string(self, bundled_tts):
         """Identifier can be any string format."""
-        bundled_tts = _load_bundled_tts()
-
         # UUID-like
         item1 = bundled_tts.TTSItem(identifier="123e4567-e89b-12d3-a456", text="Test")
         assert item1.identifier == "123e4567-e89b-12d3-a456"
@@ -171,30 +136,24 @@ class TestTTSItemDataclass:
 class TestTTSResultDataclass:
     """Test TTSResult dataclass functionality."""
 
-    def test_can_create_with_identifier_only(self):
+    def test_can_create_with_identifier_only(self, bundled_tts):
         """Should create TTSResult with just identifier."""
-        bundled_tts = _load_bundled_tts()
-
         result = bundled_tts.TTSResult(identifier="result-1")
 
         assert result.identifier == "result-1"
         assert result.audio is None
         assert result.error is None
 
-    def test_can_create_successful_result(self):
+    def test_can_create_successful_result(self, bundled_tts):
         """Should create TTSResult with audio data."""
-        bundled_tts = _load_bundled_tts()
-
         result = bundled_tts.TTSResult(identifier="result-1", audio=b"audio_data")
 
         assert result.identifier == "result-1"
         assert result.audio == b"audio_data"
         assert result.error is None
 
-    def test_can_create_error_result(self):
+    def test_can_create_error_result(self, bundled_tts):
         """Should create TTSResult with error."""
-        bundled_tts = _load_bundled_tts()
-
         result = bundled_tts.TTSResult(identifier="result-1", error="Service unavailable")
 
         assert result.identifier == "result-1"
@@ -205,10 +164,8 @@ class TestTTSResultDataclass:
 class TestResultsToJsonList:
     """Test results_to_json_list utility function."""
 
-    def test_converts_successful_result(self):
+    def test_converts_successful_result(self, bundled_tts):
         """Should convert successful result to JSON format with base64 audio."""
-        bundled_tts = _load_bundled_tts()
-
         audio_data = b"fake audio content"
         result = bundled_tts.TTSResult(identifier="item-1", audio=audio_data)
         json_list = bundled_tts.results_to_json_list([result])
@@ -220,10 +177,8 @@ class TestResultsToJsonList:
         decoded = base64.b64decode(json_list[0]["audio"])
         assert decoded == audio_data
 
-    def test_converts_error_result(self):
+    def test_converts_error_result(self, bundled_tts):
         """Should convert error result to JSON format."""
-        bundled_tts = _load_bundled_tts()
-
         result = bundled_tts.TTSResult(identifier="item-1", error="Test error")
         json_list = bundled_tts.results_to_json_list([result])
 
@@ -231,10 +186,8 @@ class TestResultsToJsonList:
         assert json_list[0]["id"] == "item-1"
         assert json_list[0]["error"] == "Test error"
 
-    def test_converts_mixed_results(self):
+    def test_converts_mixed_results(self, bundled_tts):
         """Should convert a mix of successful and error results."""
-        bundled_tts = _load_bundled_tts()
-
         results = [
             bundled_tts.TTSResult(identifier="item-1", audio=b"audio1"),
             bundled_tts.TTSResult(identifier="item-2", error="Error for item 2"),
@@ -247,17 +200,13 @@ class TestResultsToJsonList:
         assert "error" in json_list[1]
         assert "audio" in json_list[2]
 
-    def test_handles_empty_list(self):
+    def test_handles_empty_list(self, bundled_tts):
         """Should handle empty results list."""
-        bundled_tts = _load_bundled_tts()
-
         json_list = bundled_tts.results_to_json_list([])
         assert json_list == []
 
-    def test_skips_results_with_neither_audio_nor_error(self):
+    def test_skips_results_with_neither_audio_nor_error(self, bundled_tts):
         """Should skip results that have neither audio nor error."""
-        bundled_tts = _load_bundled_tts()
-
         # This shouldn't normally happen, but the function handles it
         result = bundled_tts.TTSResult(identifier="item-1")
         json_list = bundled_tts.results_to_json_list([result])
@@ -268,19 +217,8 @@ class TestResultsToJsonList:
 class TestVendorPathSetup:
     """Test that vendor path setup works correctly."""
 
-    def test_vendor_directory_exists(self):
-        """Vendor directory should exist."""
-        vendor_dir = os.path.join(_BASE_PATH, "vendor")
-        assert os.path.isdir(vendor_dir)
-
-    def test_edge_tts_package_is_vendored(self):
-        """edge_tts package should be in vendor directory."""
-        edge_tts_dir = os.path.join(_BASE_PATH, "vendor", "edge_tts")
-        assert os.path.isdir(edge_tts_dir)
-
-    def test_can_import_edge_tts_after_setup(self):
-        """Should be able to import edge_tts after setting up vendor path."""
-        _setup_bundled_tts_env()
+    def test_can_import_edge_tts_after_setup(self, bundled_tts):
+        """Should be able to import edge_tts once bundled_tts has set up the vendor path."""
         import edge_tts
 
         assert edge_tts is not None
@@ -289,48 +227,42 @@ class TestVendorPathSetup:
 class TestEnvironmentVariables:
     """Test that environment variables are properly set."""
 
-    def test_aiohttp_no_extensions_is_set(self):
-        """AIOHTTP_NO_EXTENSIONS should be set."""
-        _setup_bundled_tts_env()
-        assert os.environ.get("AIOHTTP_NO_EXTENSIONS") == "1"
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "AIOHTTP_NO_EXTENSIONS",
+            "FROZENLIST_NO_EXTENSIONS",
+            "MULTIDICT_NO_EXTENSIONS",
+            "YARL_NO_EXTENSIONS",
+            "PROPCACHE_NO_EXTENSIONS",
+        ],
+    )
+    def test_no_extensions_flag_is_set(self, monkeypatch, name):
+        """First-time vendor setup should force each vendored package into pure Python mode."""
+        monkeypatch.setattr(os, "environ", {})
+        monkeypatch.setattr(vendor_setup._state, "configured", False)
 
-    def test_frozenlist_no_extensions_is_set(self):
-        """FROZENLIST_NO_EXTENSIONS should be set."""
-        _setup_bundled_tts_env()
-        assert os.environ.get("FROZENLIST_NO_EXTENSIONS") == "1"
+        vendor_setup.ensure_vendor_path()
 
-    def test_multidict_no_extensions_is_set(self):
-        """MULTIDICT_NO_EXTENSIONS should be set."""
-        _setup_bundled_tts_env()
-        assert os.environ.get("MULTIDICT_NO_EXTENSIONS") == "1"
+        assert os.environ[name] == "1"
 
-    def test_yarl_no_extensions_is_set(self):
-        """YARL_NO_EXTENSIONS should be set."""
-        _setup_bundled_tts_env()
-        assert os.environ.get("YARL_NO_EXTENSIONS") == "1"
-
-    def test_propcache_no_extensions_is_set(self):
-        """PROPCACHE_NO_EXTENSIONS should be set."""
-        _setup_bundled_tts_env()
-        assert os.environ.get("PROPCACHE_NO_EXTENSIONS") == "1"
+    def test_bundled_tts_runs_vendor_setup(self, bundled_tts):
+        """bundled_tts should configure the environment through vendor_setup on import."""
+        assert bundled_tts.ensure_vendor_path is vendor_setup.ensure_vendor_path
 
 
 class TestTTSConfigEquality:
     """Test TTSConfig dataclass equality behavior."""
 
-    def test_equal_configs_are_equal(self):
+    def test_equal_configs_are_equal(self, bundled_tts):
         """Two TTSConfig instances with same values should be equal."""
-        bundled_tts = _load_bundled_tts()
-
         config1 = bundled_tts.TTSConfig(voice="en-US-JennyNeural", pitch="+0Hz", rate="+0%", volume="+0%")
         config2 = bundled_tts.TTSConfig(voice="en-US-JennyNeural", pitch="+0Hz", rate="+0%", volume="+0%")
 
         assert config1 == config2
 
-    def test_different_configs_are_not_equal(self):
+    def test_different_configs_are_not_equal(self, bundled_tts):
         """Two TTSConfig instances with different values should not be equal."""
-        bundled_tts = _load_bundled_tts()
-
         config1 = bundled_tts.TTSConfig(voice="en-US-JennyNeural", pitch="+0Hz", rate="+0%", volume="+0%")
         config2 = bundled_tts.TTSConfig(voice="en-US-GuyNeural", pitch="+0Hz", rate="+0%", volume="+0%")
 
@@ -340,19 +272,15 @@ class TestTTSConfigEquality:
 class TestTTSItemEquality:
     """Test TTSItem dataclass equality behavior."""
 
-    def test_equal_items_are_equal(self):
+    def test_equal_items_are_equal(self, bundled_tts):
         """Two TTSItem instances with same values should be equal."""
-        bundled_tts = _load_bundled_tts()
-
         item1 = bundled_tts.TTSItem(identifier="1", text="Hello")
         item2 = bundled_tts.TTSItem(identifier="1", text="Hello")
 
         assert item1 == item2
 
-    def test_different_items_are_not_equal(self):
+    def test_different_items_are_not_equal(self, bundled_tts):
         """Two TTSItem instances with different values should not be equal."""
-        bundled_tts = _load_bundled_tts()
-
         item1 = bundled_tts.TTSItem(identifier="1", text="Hello")
         item2 = bundled_tts.TTSItem(identifier="2", text="Hello")
 
@@ -362,19 +290,15 @@ class TestTTSItemEquality:
 class TestTTSResultEquality:
     """Test TTSResult dataclass equality behavior."""
 
-    def test_equal_results_are_equal(self):
+    def test_equal_results_are_equal(self, bundled_tts):
         """Two TTSResult instances with same values should be equal."""
-        bundled_tts = _load_bundled_tts()
-
         result1 = bundled_tts.TTSResult(identifier="1", audio=b"data")
         result2 = bundled_tts.TTSResult(identifier="1", audio=b"data")
 
         assert result1 == result2
 
-    def test_different_results_are_not_equal(self):
+    def test_different_results_are_not_equal(self, bundled_tts):
         """Two TTSResult instances with different values should not be equal."""
-        bundled_tts = _load_bundled_tts()
-
         result1 = bundled_tts.TTSResult(identifier="1", audio=b"data")
         result2 = bundled_tts.TTSResult(identifier="1", error="error")
 
@@ -384,10 +308,8 @@ class TestTTSResultEquality:
 class TestVoiceParameterFormats:
     """Test voice parameter formatting for TTSConfig."""
 
-    def test_positive_pitch_format(self):
+    def test_positive_pitch_format(self, bundled_tts):
         """Positive pitch values should use +Hz format."""
-        bundled_tts = _load_bundled_tts()
-
         config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="+10Hz",
@@ -399,10 +321,8 @@ class TestVoiceParameterFormats:
         assert config.pitch.startswith("+")
         assert config.pitch.endswith("Hz")
 
-    def test_negative_pitch_format(self):
+    def test_negative_pitch_format(self, bundled_tts):
         """Negative pitch values should use -Hz format."""
-        bundled_tts = _load_bundled_tts()
-
         config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="-10Hz",
@@ -414,10 +334,8 @@ class TestVoiceParameterFormats:
         assert config.pitch.startswith("-")
         assert config.pitch.endswith("Hz")
 
-    def test_rate_percentage_format(self):
+    def test_rate_percentage_format(self, bundled_tts):
         """Rate should use percentage format."""
-        bundled_tts = _load_bundled_tts()
-
         config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="+0Hz",
@@ -428,10 +346,8 @@ class TestVoiceParameterFormats:
         assert config.rate == "+25%"
         assert config.rate.endswith("%")
 
-    def test_volume_percentage_format(self):
+    def test_volume_percentage_format(self, bundled_tts):
         """Volume should use percentage format."""
-        bundled_tts = _load_bundled_tts()
-
         config = bundled_tts.TTSConfig(
             voice="en-US-JennyNeural",
             pitch="+0Hz",
@@ -10,56 +10,53 @@ These tests focus on:
 
 from __future__ import annotations
 
-import importlib.util
-import os
-import sys
-from unittest.mock import patch
+import re
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 
 
-_MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "edge_tts_gen.py")
+_MOCK_AUDIO_BYTES = b"fake audio data"
+_PREVIEW_STATUSES = frozenset({"ok", "no_notes", "note_none", "field_missing", "field_empty"})
+_AUDIO_MODES = frozenset({"append", "overwrite", "skip"})
 
 
-def _load_edge_tts_gen():
-    """Load the edge_tts_gen module for testing."""
-    # Create a synthetic package for relative imports
-    package_name = "edge_tts_generate"
-    package = sys.modules.setdefault(package_name, type(sys)(package_name))
-    package.__path__ = [os.path.dirname(_MODULE_PATH)]
+@pytest.fixture(scope="module")
+def mock_results(bundled_tts):
+    """Shared synthesize_batch return values for GenerateAudioQuery tests."""
+    return SimpleNamespace(
+        success=[bundled_tts.TTSResult(identifier="0", audio=_MOCK_AUDIO_BYTES)],
+        error=[bundled_tts.TTSResult(identifier="0", error="Test error")],
+        missing=[bundled_tts.TTSResult(identifier="0")],  # Neither audio nor error
+    )
 
-    spec = importlib.util.spec_from_file_location(f"{package_name}.edge_tts_gen", _MODULE_PATH)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)
-    return module
+
+def _make_note(mid, *field_names):
+    """Build a minimal Anki note stub whose note type exposes the given field names."""
+    model = {"id": mid, "flds": [{"name": name} for name in field_names]}
+    return SimpleNamespace(mid=mid, note_type=Mock(return_value=model))
 
 
 class TestItemErrorDataclass:
     """Test ItemError dataclass functionality."""
 
-    def test_can_create_item_error(self):
+    def test_can_create_item_error(self, edge_tts_gen):
         """Should create ItemError with identifier and reason."""
-        edge_tts_gen = _load_edge_tts_gen()
-
         error = edge_tts_gen.ItemError(identifier="note-123", reason="Service unavailable")
 
         assert error.identifier == "note-123"
         assert error.reason == "Service unavailable"
 
-    def test_item_error_equality(self):
+    def test_item_error_equality(self, edge_tts_gen):
         """Two ItemErrors with same values should be equal."""
-        edge_tts_gen = _load_edge_tts_gen()
-
         error1 = edge_tts_gen.ItemError(identifier="note-123", reason="Error")
         error2 = edge_tts_gen.ItemError(identifier="note-123", reason="Error")
 
         assert error1 == error2
 
-    def test_item_error_inequality(self):
+    def test_item_error_inequality(self, edge_tts_gen):
         """Two ItemErrors with different values should not be equal."""
-        edge_tts_gen = _load_edge_tts_gen()
-
         error1 = edge_tts_gen.ItemError(identifier="note-123", reason="Error A")
         error2 = edge_tts_gen.ItemError(identifier="note-123", reason="Error B")
 
@@ -69,10 +66,8 @@ class TestItemErrorDataclass:
 class TestBatchAudioResultDataclass:
     """Test BatchAudioResult dataclass functionality."""
 
-    def test_can_create_batch_result(self):
+    def test_can_create_batch_result(self, edge_tts_gen):
         """Should create BatchAudioResult with audio_map and item_errors."""
-        edge_tts_gen = _load_edge_tts_gen()
-
         result = edge_tts_gen.BatchAudioResult(
             audio_map={"note-1": b"audio1", "note-2": b"audio2"},
             item_errors=[],
@@ -82,10 +77,8 @@ class TestBatchAudioResultDataclass:
         assert result.audio_map["note-1"] == b"audio1"
         assert result.item_errors == []
 
-    def test_batch_result_with_errors(self):
+    def test_batch_result_with_errors(self, edge_tts_gen):
         """Should create BatchAudioResult with errors."""
-        edge_tts_gen = _load_edge_tts_gen()
-
         error = edge_tts_gen.ItemError(identifier="note-3", reason="Failed")
         result = edge_tts_gen.BatchAudioResult(
             audio_map={"note-1": b"audio1"},
@@ -96,10 +89,8 @@ class TestBatchAudioResultDataclass:
         assert len(result.item_errors) == 1
         assert result.item_errors[0].identifier == "note-3"
 
-    def test_batch_result_empty(self):
+    def test_batch_result_empty(self, edge_tts_gen):
         """Should create empty BatchAudioResult."""
-        edge_tts_gen = _load_edge_tts_gen()
-
         result = edge_tts_gen.BatchAudioResult(audio_map={}, item_errors=[])
 
         assert result.audio_map == {}
@@ -109,170 +100,264 @@ class TestBatchAudioResultDataclass:
 class TestGenerateAudioQuery:
     """Test GenerateAudioQuery function."""
 
-    def test_raises_on_batch_error(self):
+    def test_raises_on_batch_error(self, edge_tts_gen, mock_results):
         """Should raise RuntimeError when batch result contains errors."""
-        edge_tts_gen = _load_edge_tts_gen()
+        with patch.object(edge_tts_gen, "synthesize_batch", return_value=mock_results.error):
+            with pytest.raises(RuntimeError) as exc_info:
+                edge_tts_gen.GenerateAudioQuery(("test text", "en-US-JennyNeural"), {})
 
-        from bundled_tts import TTSResult
+        assert "Test error" in str(exc_info.value)
 
-        mock_results = [
-            TTSResult(identifier="0", error="Test error"),
-        ]
+    def test_returns_audio_bytes_on_success(self, edge_tts_gen, mock_results):
+        """Should return audio bytes on successful synthesis."""
+        with patch.object(edge_tts_gen, "synthesize_batch", return_value=mock_results.success):
+            result = edge_tts_gen.GenerateAudioQuery(("test text", "en-US-JennyNeural"), {})
 
-        with patch.object(edge_tts_gen, "synthesize_batch", return_value=mock_results):
+        assert result == _MOCK_AUDIO_BYTES
+
+    def test_raises_when_audio_missing(self, edge_tts_gen, mock_results):
+        """Should raise RuntimeError when audio is missing from result."""
+        with patch.object(edge_tts_gen, "synthesize_batch", return_value=mock_results.missing):
             with pytest.raises(RuntimeError) as exc_info:
                 edge_tts_gen.GenerateAudioQuery(("test text", "en-US-JennyNeural"), {})
 
-        assert "Test error" in str(exc_info.value)
+        assert "missing" in str(exc_info.value).lower()
 
-    def test_returns_audio_bytes_on_success(self):
-        """Should return audio bytes on successful synthesis."""
-        edge_tts_gen = _load_edge_tts_gen()
 
-        from bundled_tts import TTSResult
+class TestGetCommonFields:
+    """Test getCommonFields intersection of note type fields."""
 
-        mock_audio = b"fake audio data"
-        mock_results = [
-            TTSResult(identifier="0", audio=mock_audio),
-        ]
+    @staticmethod
+    def _common_fields(edge_tts_gen, notes):
+        with patch.object(edge_tts_gen, "mw") as mock_mw:
+            mock_mw.col.get_note.side_effect = notes.get
+            return edge_tts_gen.getCommonFields(list(notes))
 
-        with patch.object(edge_tts_gen, "synthesize_batch", return_value=mock_results):
-            result = edge_tts_gen.GenerateAudioQuery(("test text", "en-US-JennyNeural"), {})
+    def test_returns_intersection_of_fields(self, edge_tts_gen):
+        """Only fields present on every selected note's type should be returned."""
+        notes = {
+            1: _make_note(10, "Front", "Back", "Audio", "Reading", "Extra"),
+            2: _make_note(20, "Front", "Audio"),
+            3: _make_note(30, "Front", "Back", "Audio"),
+        }
 
-        assert result == mock_audio
+        assert self._common_fields(edge_tts_gen, notes) == {"Front", "Audio"}
 
-    def test_raises_when_audio_missing(self):
-        """Should raise RuntimeError when audio is missing from result."""
-        edge_tts_gen = _load_edge_tts_gen()
+    def test_notes_sharing_a_type_are_intersected_once(self, edge_tts_gen):
+        """Duplicate field sets from the same note type should not change the result."""
+        notes = {nid: _make_note(10, "Front", "Back", "Audio") for nid in range(1, 6)}
+        notes[6] = _make_note(20, "Front", "Audio")
 
-        from bundled_tts import TTSResult
+        assert self._common_fields(edge_tts_gen, notes) == {"Front", "Audio"}
 
-        # Result with neither audio nor error
-        mock_results = [
-            TTSResult(identifier="0"),
-        ]
+    def test_note_type_read_once_per_mid(self, edge_tts_gen):
+        """Field names should be built once per note type, not once per note."""
+        shared = _make_note(10, "Front", "Back")
+        notes = {nid: SimpleNamespace(mid=10, note_type=shared.note_type) for nid in range(1, 6)}
+        other = _make_note(20, "Front")
+        notes[6] = other
 
-        with patch.object(edge_tts_gen, "synthesize_batch", return_value=mock_results):
-            with pytest.raises(RuntimeError) as exc_info:
-                edge_tts_gen.GenerateAudioQuery(("test text", "en-US-JennyNeural"), {})
+        assert self._common_fields(edge_tts_gen, notes) == {"Front"}
+        assert shared.note_type.call_count == 1
+        assert other.note_type.call_count == 1
 
-        assert "missing" in str(exc_info.value).lower()
+    def test_short_circuits_on_empty_intersection(self, edge_tts_gen):
+        """Once no field is shared, the remaining notes should not be fetched."""
+        notes = {1: _make_note(10, "Front"), 2: _make_note(20, "Back")}
+        notes.update({nid: _make_note(30, "Front", "Back") for nid in range(3, 10)})
 
+        with patch.object(edge_tts_gen, "mw") as mock_mw:
+            mock_mw.col.get_note.side_effect = notes.get
+            assert edge_tts_gen.getCommonFields(list(notes)) == set()
 
-class TestPreviewNoteSnippetMaxLength:
-    """Test PREVIEW_NOTE_SNIPPET_MAX_LENGTH constant."""
+        assert mock_mw.col.get_note.call_count == 2
 
-    def test_constant_value(self):
-        """Constant should have reasonable value."""
-        edge_tts_gen = _load_edge_tts_gen()
+    def test_single_note_returns_all_fields(self, edge_tts_gen):
+        """A single selected note should yield all of its fields."""
+        notes = {1: _make_note(10, "Front", "Back")}
 
-        assert edge_tts_gen.PREVIEW_NOTE_SNIPPET_MAX_LENGTH > 0
-        assert edge_tts_gen.PREVIEW_NOTE_SNIPPET_MAX_LENGTH <= 100
+        assert self._common_fields(edge_tts_gen, notes) == {"Front", "Back"}
 
-    def test_snippet_truncation_logic(self):
-        """Test snippet truncation using the constant."""
-        edge_tts_gen = _load_edge_tts_gen()
+    def test_no_notes_returns_empty_set(self, edge_tts_gen):
+        """An empty selection should produce no common fields."""
+        assert self._common_fields(edge_tts_gen, {}) == set()
 
-        max_len = edge_tts_gen.PREVIEW_NOTE_SNIPPET_MAX_LENGTH
-        long_text = "A" * (max_len + 50)
+    def test_raises_on_missing_note(self, edge_tts_gen):
+        """A note that cannot be loaded should raise a descriptive error."""
+        notes = {1: _make_note(10, "Front"), 2: None}
 
-        snippet = long_text[:max_len]
-        if len(long_text) > max_len:
-            snippet += "..."
+        with pytest.raises(Exception, match="Note with id 2 is None"):
+            self._common_fields(edge_tts_gen, notes)
 
-        assert len(snippet) == max_len + 3
 
+class TestGetSpeakerList:
+    """Test getSpeakerList config handling."""
 
-class TestRegexPatterns:
-    """Test regex patterns used in text processing."""
+    def test_returns_copy_of_configured_speakers(self, edge_tts_gen, sample_config):
+        """Configured speakers should be returned as an independent list."""
+        speakers = edge_tts_gen.getSpeakerList(sample_config)
+
+        assert speakers == sample_config["speakers"]
+        assert speakers is not sample_config["speakers"]
 
-    def test_tag_re_removes_html_tags(self):
-        """TAG_RE should remove HTML tags."""
-        edge_tts_gen = _load_edge_tts_gen()
+    @pytest.mark.parametrize("config", [{}, {"speakers": None}], ids=["missing", "null"])
+    def test_missing_speakers_returns_empty_list(self, edge_tts_gen, config):
+        """A config without speakers should yield an empty list."""
+        assert edge_tts_gen.getSpeakerList(config) == []
 
-        text = "<div><b>Bold</b> text</div>"
-        result = edge_tts_gen.TAG_RE.sub("", text)
-        assert result == "Bold text"
 
-    def test_tag_re_removes_html_comments(self):
-        """TAG_RE should remove HTML comments."""
-        edge_tts_gen = _load_edge_tts_gen()
+class TestGetSpeaker:
+    """Test getSpeaker combo box lookup."""
 
-        text = "Hello<!-- comment -->World"
-        result = edge_tts_gen.TAG_RE.sub("", text)
-        assert result == "HelloWorld"
+    @staticmethod
+    def _combo(index, *items):
+        """Build a lightweight stand-in for a QComboBox."""
+        return SimpleNamespace(currentIndex=lambda: index, itemText=items.__getitem__)
+
+    @pytest.mark.parametrize(
+        ("index", "expected"),
+        [(1, "en-US-JennyNeural"), (0, "ja-JP-NanamiNeural")],
+        ids=["selected_speaker", "first_speaker_when_index_zero"],
+    )
+    def test_returns_current_speaker(self, edge_tts_gen, index, expected):
+        """The text of the current combo entry should be returned."""
+        combo = self._combo(index, "ja-JP-NanamiNeural", "en-US-JennyNeural")
+
+        assert edge_tts_gen.getSpeaker(combo) == expected
+
+
+class TestPreviewNoteIndex:
+    """Test clamping of the preview note selection."""
+
+    @pytest.mark.parametrize(
+        ("combo_index", "note_count", "expected"),
+        [(0, 1, 0), (5, 3, 0), (-1, 3, 0), (10, 2, 0), (1, 3, 1), (2, 4, 2)],
+        ids=["single_note", "past_end", "no_selection", "far_past_end", "middle", "valid_unchanged"],
+    )
+    def test_clamps_to_valid_note(self, edge_tts_gen, combo_index, note_count, expected):
+        """Out-of-range selections should fall back to the first note."""
+        assert edge_tts_gen._preview_note_index(combo_index, note_count) == expected
+
+
+class TestPreviewNoteSnippetMaxLength:
+    """Test PREVIEW_NOTE_SNIPPET_MAX_LENGTH constant."""
+
+    def test_constant_value(self, edge_tts_gen):
+        """Constant should have reasonable value."""
+        assert edge_tts_gen.PREVIEW_NOTE_SNIPPET_MAX_LENGTH > 0
+        assert edge_tts_gen.PREVIEW_NOTE_SNIPPET_MAX_LENGTH <= 100
 
-    def test_entity_re_removes_html_entities(self):
-        """ENTITY_RE should remove HTML entities."""
-        edge_tts_gen = _load_edge_tts_gen()
+    def test_snippet_truncation_logic(self, edge_tts_gen):
+        """Test snippet truncation using the constant."""
+        max_len = edge_tts_gen.PREVIEW_NOTE_SNIPPET_MAX_LENGTH
+        long_text = "A" * (max_len + 50)
 
-        text = "Hello&nbsp;World&amp;Test"
-        result = edge_tts_gen.ENTITY_RE.sub("", text)
-        assert result == "HelloWorldTest"
+        snippet = edge_tts_gen._note_snippet(long_text)
 
-    def test_bracket_reading_re_extracts_readings(self):
-        """BRACKET_READING_RE should extract readings from brackets."""
-        edge_tts_gen = _load_edge_tts_gen()
+        assert len(snippet) == max_len + 3
+        assert snippet.endswith("...")
 
-        text = "漢字[かんじ]"
-        result = edge_tts_gen.BRACKET_READING_RE.sub(r"\1", text)
-        assert result == "かんじ"
+    @pytest.mark.parametrize("length_delta", [-10, 0], ids=["short", "exact"])
+    def test_snippet_keeps_text_within_limit(self, edge_tts_gen, length_delta):
+        """Text that fits should be returned unchanged, without an ellipsis."""
+        text = "A" * (edge_tts_gen.PREVIEW_NOTE_SNIPPET_MAX_LENGTH + length_delta)
 
-    def test_bracket_content_re_removes_brackets(self):
-        """BRACKET_CONTENT_RE should remove bracket content."""
-        edge_tts_gen = _load_edge_tts_gen()
+        assert edge_tts_gen._note_snippet(text) is text
 
-        text = "word[info]more"
-        result = edge_tts_gen.BRACKET_CONTENT_RE.sub("", text)
-        assert result == "wordmore"
 
-    def test_whitespace_re_removes_spaces(self):
-        """WHITESPACE_RE should remove spaces."""
-        edge_tts_gen = _load_edge_tts_gen()
+class TestRegexPatterns:
+    """Test regex patterns used in text processing."""
 
-        text = "Hello World Test"
-        result = edge_tts_gen.WHITESPACE_RE.sub("", text)
-        assert result == "HelloWorldTest"
+    @pytest.mark.parametrize(
+        ("pattern_name", "repl", "input_text", "expected"),
+        [
+            ("MARKUP_RE", "", "<div><b>Bold</b> text</div>", "Bold text"),
+            ("MARKUP_RE", "", "Hello<!-- comment -->World", "HelloWorld"),
+            ("MARKUP_RE", "", "Hello<!-- a - b -- c -->World", "HelloWorld"),
+            ("MARKUP_RE", "", "Hello<!-- a\n> b -->World", "HelloWorld"),
+            ("MARKUP_RE", "", "Hello&nbsp;World&amp;Test", "HelloWorldTest"),
+            ("MARKUP_RE", "", "<p>Tom&amp;Jerry</p>&nbsp;<!-- x -->", "TomJerry"),
+            ("BRACKET_READING_RE", r"\1", "漢字[かんじ]", "かんじ"),
+            ("BRACKET_READING_RE", r"\1", "日本語[にほんご] 勉強[べんきょう]", "にほんごべんきょう"),
+            ("BRACKET_READING_RE", r"\1", "漢字[かん\nじ]", "漢字[かん\nじ]"),
+            ("BRACKET_CONTENT_RE", "", "word[info]more", "wordmore"),
+            ("BRACKET_CONTENT_RE", "", "a[b]c[d]e", "ace"),
+            ("BRACKET_CONTENT_RE", "", "open[ended\n]", "open[ended\n]"),
+        ],
+        ids=[
+            "markup_re_removes_html_tags",
+            "markup_re_removes_html_comments",
+            "markup_re_removes_comments_containing_dashes",
+            "markup_re_removes_multiline_comments",
+            "markup_re_removes_html_entities",
+            "markup_re_removes_mixed_markup",
+            "bracket_reading_re_extracts_readings",
+            "bracket_reading_re_consumes_leading_space",
+            "bracket_reading_re_stops_at_newline",
+            "bracket_content_re_removes_brackets",
+            "bracket_content_re_stops_at_first_close",
+            "bracket_content_re_stops_at_newline",
+        ],
+    )
+    def test_pattern_substitution(self, edge_tts_gen, pattern_name, repl, input_text, expected):
+        """Each module-level pattern should clean its target text."""
+        assert getattr(edge_tts_gen, pattern_name).sub(repl, input_text) == expected
+
+    def test_patterns_are_compiled_at_import(self, edge_tts_gen):
+        """All text-cleaning patterns should be compiled once at module import."""
+        pattern_names = [name for name in vars(edge_tts_gen) if name.endswith("_RE")]
+
+        assert pattern_names
+        for name in pattern_names:
+            assert isinstance(getattr(edge_tts_gen, name), re.Pattern), name
 
 
 class TestCreateNewFieldOption:
     """Test CREATE_NEW_FIELD_OPTION constant."""
 
-    def test_constant_exists(self):
+    def test_constant_exists(self, edge_tts_gen):
         """CREATE_NEW_FIELD_OPTION should exist."""
-        edge_tts_gen = _load_edge_tts_gen()
         assert hasattr(edge_tts_gen, "CREATE_NEW_FIELD_OPTION")
 
-    def test_constant_is_distinguishable(self):
+    def test_constant_is_distinguishable(self, edge_tts_gen):
         """CREATE_NEW_FIELD_OPTION should be easily distinguishable."""
-        edge_tts_gen = _load_edge_tts_gen()
-
         # Should contain visual markers that distinguish from field names
         option = edge_tts_gen.CREATE_NEW_FIELD_OPTION
         assert "[" in option or "+" in option
 
+    @pytest.mark.parametrize(
+        ("index", "expected"),
+        [(3, True), (0, False), (2, False), (-1, False)],
+        ids=["last_item", "first_field", "last_field", "no_selection"],
+    )
+    def test_create_new_field_index_is_last_item(self, edge_tts_gen, index, expected):
+        """Only the trailing dropdown entry should be treated as the create option."""
+        combo = SimpleNamespace(count=lambda: 4)
+
+        assert edge_tts_gen._is_create_new_field_index(combo, index) is expected
+
+    def test_create_new_field_index_on_empty_combo(self, edge_tts_gen):
+        """An empty dropdown has no create option to select."""
+        combo = SimpleNamespace(count=lambda: 0)
+
+        assert edge_tts_gen._is_create_new_field_index(combo, -1) is False
+
 
 class TestGenerateAudioBatchEdgeCases:
     """Test edge cases in GenerateAudioBatch."""
 
-    def test_handles_synthesis_exception(self):
+    def test_handles_synthesis_exception(self, edge_tts_gen):
         """Should wrap synthesis exceptions in RuntimeError."""
-        edge_tts_gen = _load_edge_tts_gen()
-
         with patch.object(edge_tts_gen, "synthesize_batch", side_effect=Exception("Network error")):
             with pytest.raises(RuntimeError) as exc_info:
                 edge_tts_gen.GenerateAudioBatch([("id", "text", "voice")], {})
 
         assert "Network error" in str(exc_info.value)
 
-    def test_uses_config_values(self):
+    def test_uses_config_values(self, edge_tts_gen, bundled_tts):
         """Should use pitch/rate/volume from config."""
-        edge_tts_gen = _load_edge_tts_gen()
-
-        from bundled_tts import TTSResult
-
-        mock_results = [
-            TTSResult(identifier="note-1", audio=b"audio"),
+        batch_results = [
+            bundled_tts.TTSResult(identifier="note-1", audio=b"audio"),
         ]
 
         captured_config = None
@@ -280,7 +365,7 @@ class TestGenerateAudioBatchEdgeCases:
         def mock_synthesize(items, config):
             nonlocal captured_config
             captured_config = config
-            return mock_results
+            return batch_results
 
         config = {
             "pitch_slider_value": 10,
@@ -296,14 +381,10 @@ class TestGenerateAudioBatchEdgeCases:
         assert captured_config.rate == "-5%"
         assert captured_config.volume == "+25%"
 
-    def test_uses_timeout_config(self):
+    def test_uses_timeout_config(self, edge_tts_gen, bundled_tts):
         """Should use timeout settings from config."""
-        edge_tts_gen = _load_edge_tts_gen()
-
-        from bundled_tts import TTSResult
-
-        mock_results = [
-            TTSResult(identifier="note-1", audio=b"audio"),
+        batch_results = [
+            bundled_tts.TTSResult(identifier="note-1", audio=b"audio"),
         ]
 
         captured_config = None
@@ -311,7 +392,7 @@ class TestGenerateAudioBatchEdgeCases:
         def mock_synthesize(items, config):
             nonlocal captured_config
             captured_config = config
-            return mock_results
+            return batch_results
 
         config = {
             "stream_timeout_seconds": 60.0,
@@ -329,186 +410,134 @@ class TestGenerateAudioBatchEdgeCases:
 class TestPreviewCacheKeyLogic:
     """Test preview cache key generation logic."""
 
-    def test_cache_key_includes_all_parameters(self):
-        """Cache key should include text, speaker, pitch, rate, volume."""
+    def test_cache_key_behavior(self):
+        """Cache keys should hold all five parameters and compare by value (smoke check)."""
         # Simulate the cache key logic from MyDialog
-        preview_text = "Hello world"
-        speaker = "en-US-JennyNeural"
-        pitch = "+10Hz"
-        rate = "-5%"
-        volume = "+0%"
-
-        cache_key = (preview_text, speaker, pitch, rate, volume)
+        cache_key = ("Hello world", "en-US-JennyNeural", "+10Hz", "-5%", "+0%")
+        base_key = ("text", "voice1", "+0Hz", "+0%", "+0%")
 
         assert len(cache_key) == 5
-        assert cache_key[0] == preview_text
-        assert cache_key[1] == speaker
-
-    def test_different_parameters_produce_different_keys(self):
-        """Different parameters should produce different cache keys."""
-        key1 = ("text", "voice1", "+0Hz", "+0%", "+0%")
-        key2 = ("text", "voice2", "+0Hz", "+0%", "+0%")
-        key3 = ("text", "voice1", "+10Hz", "+0%", "+0%")
-
-        assert key1 != key2
-        assert key1 != key3
-
-    def test_same_parameters_produce_same_key(self):
-        """Same parameters should produce identical cache keys."""
-        key1 = ("text", "voice", "+0Hz", "+0%", "+0%")
-        key2 = ("text", "voice", "+0Hz", "+0%", "+0%")
-
-        assert key1 == key2
+        assert cache_key[:2] == ("Hello world", "en-US-JennyNeural")
+        assert base_key != ("text", "voice2", "+0Hz", "+0%", "+0%")
+        assert base_key != ("text", "voice1", "+10Hz", "+0%", "+0%")
+        assert base_key == ("text", "voice1", "+0Hz", "+0%", "+0%")
 
 
 class TestPreviewParameterFormatting:
     """Test parameter formatting for preview."""
 
-    def test_positive_pitch_formatting(self):
-        """Positive pitch should be formatted with + sign."""
-        pitch_value = 10
-        pitch = f"{pitch_value:+}Hz"
-        assert pitch == "+10Hz"
-
-    def test_negative_pitch_formatting(self):
-        """Negative pitch should be formatted with - sign."""
-        pitch_value = -10
-        pitch = f"{pitch_value:+}Hz"
-        assert pitch == "-10Hz"
-
-    def test_zero_pitch_formatting(self):
-        """Zero pitch should be formatted with + sign."""
-        pitch_value = 0
-        pitch = f"{pitch_value:+}Hz"
-        assert pitch == "+0Hz"
-
-    def test_rate_formatting(self):
-        """Rate should be formatted as percentage."""
-        rate_value = 25
-        rate = f"{rate_value:+}%"
-        assert rate == "+25%"
-
-    def test_volume_formatting(self):
-        """Volume should be formatted as percentage."""
-        volume_value = -50
-        volume = f"{volume_value:+}%"
-        assert volume == "-50%"
+    @pytest.mark.parametrize(
+        ("format_name", "value", "expected"),
+        [
+            ("PITCH_FORMAT", 10, "+10Hz"),
+            ("PITCH_FORMAT", -10, "-10Hz"),
+            ("PITCH_FORMAT", 0, "+0Hz"),
+            ("PERCENT_FORMAT", 25, "+25%"),
+            ("PERCENT_FORMAT", -50, "-50%"),
+            ("PITCH_FORMAT", 1.6, "+1Hz"),
+        ],
+        ids=["positive_pitch", "negative_pitch", "zero_pitch", "rate", "volume", "non_integer_truncates"],
+    )
+    def test_signed_formatting(self, edge_tts_gen, format_name, value, expected):
+        """Prosody values should always carry an explicit sign.
+
+        The constants truncate non-integers, which is why _format_prosody rounds config values first.
+        """
+        assert getattr(edge_tts_gen, format_name) % value == expected
 
 
 class TestTextProcessingPipeline:
     """Test the full text processing pipeline logic."""
 
-    def test_full_pipeline_processes_html(self):
-        """Full pipeline should process HTML correctly."""
-        edge_tts_gen = _load_edge_tts_gen()
-
-        text = "<div>&nbsp;Hello<br/>World</div>"
-
-        # Step 1: Remove entities
-        text = edge_tts_gen.ENTITY_RE.sub("", text)
-        # Step 2: Remove tags
-        text = edge_tts_gen.TAG_RE.sub("", text)
-
-        assert text == "HelloWorld"
-
-    def test_full_pipeline_processes_readings(self):
-        """Full pipeline should process reading annotations."""
-        edge_tts_gen = _load_edge_tts_gen()
-
-        text = "漢字[かんじ]を勉強[べんきょう]する"
-
-        # Extract readings
-        text = edge_tts_gen.BRACKET_READING_RE.sub(r"\1", text)
-
-        assert "かんじ" in text
-        assert "べんきょう" in text
-
-    def test_full_pipeline_removes_brackets(self):
-        """Full pipeline should remove bracket content when enabled."""
-        edge_tts_gen = _load_edge_tts_gen()
-
-        text = "word[extra info]end"
-        text = edge_tts_gen.BRACKET_CONTENT_RE.sub("", text)
-
-        assert text == "wordend"
-
-    def test_full_pipeline_handles_mixed_content(self):
-        """Full pipeline should handle mixed HTML and bracket content."""
-        edge_tts_gen = _load_edge_tts_gen()
-
-        text = "<b>Bold[info]</b>&nbsp;text"
-
-        # Process in order
-        text = edge_tts_gen.ENTITY_RE.sub("", text)
-        text = edge_tts_gen.TAG_RE.sub("", text)
-        text = edge_tts_gen.BRACKET_CONTENT_RE.sub("", text)
-
-        assert text == "Boldtext"
+    @pytest.mark.parametrize(
+        ("steps", "input_text", "expected"),
+        [
+            ((("MARKUP_RE", ""),), "<div>&nbsp;Hello<br/>World</div>", "HelloWorld"),
+            ((("BRACKET_READING_RE", r"\1"),), "漢字[かんじ]を勉強[べんきょう]する", "かんじべんきょうする"),
+            ((("BRACKET_CONTENT_RE", ""),), "word[extra info]end", "wordend"),
+            (
+                (("MARKUP_RE", ""), ("BRACKET_CONTENT_RE", "")),
+                "<b>Bold[info]</b>&nbsp;text",
+                "Boldtext",
+            ),
+        ],
+        ids=["processes_html", "processes_readings", "removes_brackets", "handles_mixed_content"],
+    )
+    def test_full_pipeline(self, edge_tts_gen, steps, input_text, expected):
+        """Applying the pipeline steps in order should produce the cleaned text."""
+        pipeline = [(getattr(edge_tts_gen, name), repl) for name, repl in steps]
+
+        text = input_text
+        for pattern, repl in pipeline:
+            text = pattern.sub(repl, text)
+
+        assert text == expected
+
+    @pytest.mark.parametrize(
+        ("input_text", "ignore_brackets", "strip_whitespace", "expected"),
+        [
+            ("<b>Hello</b> &amp; world", False, False, "Hello  world"),
+            ("漢字[かんじ]を<br>勉強[べんきょう;a,h]", False, False, "かんじべんきょう;a,h"),
+            ("word[extra] end", True, False, "extra end"),
+            ("日本語 です", False, True, "日本語です"),
+            ("plain text", True, True, "plaintext"),
+        ],
+        ids=["markup_only", "keeps_reading_content", "replaces_word_with_reading", "strips_spaces", "no_brackets"],
+    )
+    def test_clean_note_text(self, edge_tts_gen, input_text, ignore_brackets, strip_whitespace, expected):
+        """_clean_note_text should apply the markup, bracket and whitespace steps the options select."""
+        assert edge_tts_gen._clean_note_text(input_text, ignore_brackets, strip_whitespace) == expected
 
 
 class TestWhitespaceHandlingByLanguage:
     """Test whitespace handling based on voice language."""
 
-    def test_japanese_voice_strips_whitespace(self):
-        """Japanese voices should strip whitespace."""
-        voice = "ja-JP-NanamiNeural"
-        language_code = voice.split("-")[0].lower()
-
-        assert language_code == "ja"
-        assert language_code in {"ja", "zh"}
-
-    def test_chinese_voice_strips_whitespace(self):
-        """Chinese voices should strip whitespace."""
-        voice = "zh-CN-XiaoxiaoNeural"
-        language_code = voice.split("-")[0].lower()
-
-        assert language_code == "zh"
-        assert language_code in {"ja", "zh"}
-
-    def test_english_voice_preserves_whitespace(self):
-        """English voices should preserve whitespace."""
-        voice = "en-US-JennyNeural"
-        language_code = voice.split("-")[0].lower()
-
-        assert language_code == "en"
-        assert language_code not in {"ja", "zh"}
-
-    def test_german_voice_preserves_whitespace(self):
-        """German voices should preserve whitespace."""
-        voice = "de-DE-KatjaNeural"
-        language_code = voice.split("-")[0].lower()
-
-        assert language_code == "de"
-        assert language_code not in {"ja", "zh"}
+    @pytest.mark.parametrize(
+        ("voice", "expected"),
+        [
+            ("ja-JP-NanamiNeural", True),
+            ("zh-CN-XiaoxiaoNeural", True),
+            ("en-US-JennyNeural", False),
+            ("de-DE-KatjaNeural", False),
+            ("", False),
+        ],
+        ids=["japanese_strips", "chinese_strips", "english_preserves", "german_preserves", "missing_voice_preserves"],
+    )
+    def test_should_strip_whitespace(self, edge_tts_gen, voice, expected):
+        """Only voices for languages written without spaces should strip whitespace."""
+        assert edge_tts_gen._should_strip_whitespace(voice) is expected
 
 
 class TestPreviewTextStatusValues:
     """Test preview text status return values."""
 
-    def test_valid_status_ok(self):
-        """'ok' is a valid status value."""
-        valid_statuses = {"ok", "no_notes", "note_none", "field_missing", "field_empty"}
-        assert "ok" in valid_statuses
+    @pytest.mark.parametrize("status", ["ok", "no_notes", "note_none", "field_missing", "field_empty"])
+    def test_valid_status(self, status):
+        """Each status returned by _getPreviewTextFromNote is a known value."""
+        assert status in _PREVIEW_STATUSES
 
-    def test_valid_status_no_notes(self):
-        """'no_notes' is a valid status value."""
-        valid_statuses = {"ok", "no_notes", "note_none", "field_missing", "field_empty"}
-        assert "no_notes" in valid_statuses
 
-    def test_valid_status_note_none(self):
-        """'note_none' is a valid status value."""
-        valid_statuses = {"ok", "no_notes", "note_none", "field_missing", "field_empty"}
-        assert "note_none" in valid_statuses
+class TestAudioModeHandlers:
+    """Test the per-mode destination field update table."""
 
-    def test_valid_status_field_missing(self):
-        """'field_missing' is a valid status value."""
-        valid_statuses = {"ok", "no_notes", "note_none", "field_missing", "field_empty"}
-        assert "field_missing" in valid_statuses
+    def test_handles_every_audio_mode(self, edge_tts_gen):
+        """Every selectable audio handling mode should have a field handler."""
+        assert set(edge_tts_gen.AUDIO_MODE_HANDLERS) == _AUDIO_MODES
 
-    def test_valid_status_field_empty(self):
-        """'field_empty' is a valid status value."""
-        valid_statuses = {"ok", "no_notes", "note_none", "field_missing", "field_empty"}
-        assert "field_empty" in valid_statuses
+    @pytest.mark.parametrize(
+        ("mode", "current_content", "expected"),
+        [
+            ("append", "[sound:old.mp3]", "[sound:old.mp3] [sound:new.mp3]"),
+            ("append", "", "[sound:new.mp3]"),
+            ("overwrite", "[sound:old.mp3]", "[sound:new.mp3]"),
+            ("overwrite", "", "[sound:new.mp3]"),
+            ("skip", "", "[sound:new.mp3]"),
+        ],
+        ids=["append_existing", "append_empty", "overwrite_existing", "overwrite_empty", "skip_empty"],
+    )
+    def test_field_update(self, edge_tts_gen, mode, current_content, expected):
+        """Each mode should place the new audio tag in the destination field."""
+        assert edge_tts_gen.AUDIO_MODE_HANDLERS[mode](current_content, "[sound:new.mp3]") == expected
 
 
 class TestUIFeatures:
@@ -540,38 +569,26 @@ class TestUIFeatures:
         assert str(note_count) in message
         assert "Overwrite" in message
 
-    def test_slider_default_values(self):
-        """Slider default values should be 0 for all adjustments."""
-        config = {
-            "volume_slider_value": 0,
-            "pitch_slider_value": 0,
-            "speed_slider_value": 0,
-        }
-
-        assert config.get("volume_slider_value", 0) == 0
-        assert config.get("pitch_slider_value", 0) == 0
-        assert config.get("speed_slider_value", 0) == 0
-
-    def test_slider_ranges(self):
-        """Slider ranges should be within expected bounds."""
-        volume_min, volume_max = -100, 100
-        pitch_min, pitch_max = -50, 50
-        speed_min, speed_max = -50, 50
-
-        # Volume has wider range
-        assert volume_max - volume_min == 200
-
-        # Pitch and speed have same range
-        assert pitch_max - pitch_min == speed_max - speed_min == 100
+    @pytest.mark.parametrize(
+        ("config_key", "slider_min", "slider_max", "span"),
+        [
+            ("volume_slider_value", -100, 100, 200),
+            ("pitch_slider_value", -50, 50, 100),
+            ("speed_slider_value", -50, 50, 100),
+        ],
+        ids=["volume", "pitch", "speed"],
+    )
+    def test_slider_invariants(self, sample_config, config_key, slider_min, slider_max, span):
+        """Sliders should default to 0 and span their expected symmetric range."""
+        value = sample_config.get(config_key, 0)
+
+        assert value == 0
+        assert slider_min <= value <= slider_max
+        assert slider_max - slider_min == span
 
     def test_audio_handling_modes(self):
         """Audio handling modes should include expected values."""
-        modes = {"append", "overwrite", "skip"}
-
-        assert "append" in modes
-        assert "overwrite" in modes
-        assert "skip" in modes
-        assert len(modes) == 3
+        assert {"append", "overwrite", "skip"} == _AUDIO_MODES
 
 
 class TestSessionState:
@@ -1,33 +1,11 @@
 """Tests for GenerateAudioBatch error handling."""
 
-import importlib.util
-import os
-import sys
 from unittest.mock import patch
 
 
-_MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "edge_tts_gen.py")
-
-
-def _load_edge_tts_gen():
-    """Load the edge_tts_gen module as part of a synthetic package for testing."""
-
-    package_name = "edge_tts_generate"
-    package = sys.modules.setdefault(package_name, type(sys)(package_name))
-    package.__path__ = [os.path.dirname(_MODULE_PATH)]
-
-    spec = importlib.util.spec_from_file_location(f"{package_name}.edge_tts_gen", _MODULE_PATH)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[spec.name] = module
-    spec.loader.exec_module(module)
-    return module
-
-
-def test_generate_audio_batch_reports_item_errors(monkeypatch):
+def test_generate_audio_batch_reports_item_errors(edge_tts_gen):
     """An error entry in the batch result should be returned for caller handling."""
 
-    edge_tts_gen = _load_edge_tts_gen()
-
     # Mock the bundled_tts module's synthesize_batch function
     from bundled_tts import TTSResult
 
@@ -47,11 +25,9 @@ def test_generate_audio_batch_reports_item_errors(monkeypatch):
     assert "Missing audio data" in result.item_errors[1].reason
 
 
-def test_generate_audio_batch_returns_audio_on_success(monkeypatch):
+def test_generate_audio_batch_returns_audio_on_success(edge_tts_gen):
     """Successful audio generation should return audio bytes in audio_map."""
 
-    edge_tts_gen = _load_edge_tts_gen()
-
     from bundled_tts import TTSResult
 
     mock_audio = b"fake audio data"
@@ -67,11 +43,9 @@ def test_generate_audio_batch_returns_audio_on_success(monkeypatch):
     assert len(result.item_errors) == 0
 
 
-def test_generate_audio_batch_handles_empty_items():
+def test_generate_audio_batch_handles_empty_items(edge_tts_gen):
     """Empty items list should return empty result."""
 
-    edge_tts_gen = _load_edge_tts_gen()
-
     result = edge_tts_gen.GenerateAudioBatch([], {})
 
     assert result.audio_map == {}
@@ -3,43 +3,29 @@ Tests for the logging_config module.
 Verifies that the logging system is properly configured and functions correctly.
 """
 
-import importlib.util
 import logging
 import os
 
-
-_MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logging_config.py")
-
-
-def load_logging_config():
-    """Load a fresh copy of the logging_config module."""
-    spec = importlib.util.spec_from_file_location("logging_config", _MODULE_PATH)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+import pytest
 
 
 class TestLoggingConfigConstants:
     """Test logging configuration constants."""
 
-    def test_default_log_level_is_warning(self):
+    def test_default_log_level_is_warning(self, logging_config):
         """Default log level should be WARNING for production use."""
-        logging_config = load_logging_config()
         assert logging_config.DEFAULT_LOG_LEVEL == "WARNING"
 
-    def test_default_max_log_size_is_sensible(self):
+    def test_default_max_log_size_is_sensible(self, logging_config):
         """Default max log size should be reasonable (5MB)."""
-        logging_config = load_logging_config()
         assert logging_config.DEFAULT_MAX_LOG_SIZE_MB == 5
 
-    def test_default_backup_count_is_sensible(self):
+    def test_default_backup_count_is_sensible(self, logging_config):
         """Default backup count should be reasonable (3 files)."""
-        logging_config = load_logging_config()
         assert logging_config.DEFAULT_LOG_BACKUP_COUNT == 3
 
-    def test_log_filename_is_descriptive(self):
+    def test_log_filename_is_descriptive(self, logging_config):
         """Log filename should be descriptive."""
-        logging_config = load_logging_config()
         assert "edge_tts" in logging_config.LOG_FILENAME
         assert logging_config.LOG_FILENAME.endswith(".log")
 
@@ -47,77 +33,51 @@ class TestLoggingConfigConstants:
 class TestGetLogLevel:
     """Test log level string to constant conversion."""
 
-    def test_converts_debug_level(self):
-        """Should convert DEBUG string to logging.DEBUG."""
-        logging_config = load_logging_config()
-        assert logging_config._get_log_level("DEBUG") == logging.DEBUG
-
-    def test_converts_info_level(self):
-        """Should convert INFO string to logging.INFO."""
-        logging_config = load_logging_config()
-        assert logging_config._get_log_level("INFO") == logging.INFO
-
-    def test_converts_warning_level(self):
-        """Should convert WARNING string to logging.WARNING."""
-        logging_config = load_logging_config()
-        assert logging_config._get_log_level("WARNING") == logging.WARNING
-
-    def test_converts_error_level(self):
-        """Should convert ERROR string to logging.ERROR."""
-        logging_config = load_logging_config()
-        assert logging_config._get_log_level("ERROR") == logging.ERROR
-
-    def test_converts_critical_level(self):
-        """Should convert CRITICAL string to logging.CRITICAL."""
-        logging_config = load_logging_config()
-        assert logging_config._get_log_level("CRITICAL") == logging.CRITICAL
-
-    def test_case_insensitive_conversion(self):
-        """Should handle case-insensitive level strings."""
-        logging_config = load_logging_config()
-        assert logging_config._get_log_level("debug") == logging.DEBUG
-        assert logging_config._get_log_level("Debug") == logging.DEBUG
-        assert logging_config._get_log_level("DEBUG") == logging.DEBUG
-
-    def test_defaults_to_warning_for_invalid_level(self):
-        """Should default to WARNING for invalid level strings."""
-        logging_config = load_logging_config()
-        assert logging_config._get_log_level("INVALID") == logging.WARNING
-        assert logging_config._get_log_level("") == logging.WARNING
+    @pytest.mark.parametrize(
+        ("level_str", "expected"),
+        [
+            ("DEBUG", logging.DEBUG),
+            ("INFO", logging.INFO),
+            ("WARNING", logging.WARNING),
+            ("ERROR", logging.ERROR),
+            ("CRITICAL", logging.CRITICAL),
+            ("debug", logging.DEBUG),
+            ("Debug", logging.DEBUG),
+            ("INVALID", logging.WARNING),
+            ("", logging.WARNING),
+        ],
+    )
+    def test_get_log_level(self, logging_config, level_str, expected):
+        """Level strings should map case-insensitively, defaulting to WARNING when unknown."""
+        assert logging_config._get_log_level(level_str) == expected
 
 
 class TestGetLogger:
     """Test the get_logger function."""
 
-    def test_returns_logger_instance(self):
+    def test_returns_logger_instance(self, logging_config):
         """Should return a logging.Logger instance."""
-        logging_config = load_logging_config()
         logger = logging_config.get_logger("test_module")
         assert isinstance(logger, logging.Logger)
 
-    def test_normalizes_module_names(self):
+    def test_normalizes_module_names(self, logging_config):
         """Should normalize module names under add-on namespace."""
-        logging_config = load_logging_config()
-
         # Test with leading dots (relative import style)
         logger = logging_config.get_logger(".edge_tts_gen")
         assert "edge_tts_generate" in logger.name
 
-    def test_handles_main_module_name(self):
+    def test_handles_main_module_name(self, logging_config):
         """Should handle __main__ module name."""
-        logging_config = load_logging_config()
         logger = logging_config.get_logger("__main__")
         assert "edge_tts_generate" in logger.name
 
-    def test_handles_bundled_tts_name(self):
+    def test_handles_bundled_tts_name(self, logging_config):
         """Should handle bundled_tts module name."""
-        logging_config = load_logging_config()
         logger = logging_config.get_logger("bundled_tts")
         assert "edge_tts_generate" in logger.name
 
-    def test_caches_logger_instances(self):
+    def test_caches_logger_instances(self, logging_config):
         """Should cache and return same logger for same name."""
-        logging_config = load_logging_config()
         logger1 = logging_config.get_logger("test_module")
         logger2 = logging_config.get_logger("test_module")
         # Both should be the same logger object
@@ -127,38 +87,32 @@ class TestGetLogger:
 class TestGetLogFilePath:
     """Test the get_log_file_path function."""
 
-    def test_returns_absolute_path(self):
+    def test_returns_absolute_path(self, logging_config):
         """Should return an absolute path."""
-        logging_config = load_logging_config()
         path = logging_config.get_log_file_path()
         assert os.path.isabs(path)
 
-    def test_path_ends_with_log_extension(self):
+    def test_path_ends_with_log_extension(self, logging_config):
         """Should return path ending with .log."""
-        logging_config = load_logging_config()
         path = logging_config.get_log_file_path()
         assert path.endswith(".log")
 
-    def test_path_in_addon_directory(self):
+    def test_path_in_addon_directory(self, logging_config, base_path):
         """Should return path in the add-on directory."""
-        logging_config = load_logging_config()
         path = logging_config.get_log_file_path()
-        addon_dir = os.path.dirname(_MODULE_PATH)
-        assert path.startswith(addon_dir)
+        assert path.startswith(base_path)
 
 
 class TestSetLogLevel:
     """Test the set_log_level function."""
 
-    def test_updates_root_logger_level(self):
+    def test_updates_root_logger_level(self, isolated_logging_config):
         """Should update the root logger level."""
-        logging_config = load_logging_config()
-
         # Get the root logger
         root_logger = logging.getLogger("edge_tts_generate")
 
         # Set to DEBUG level
-        logging_config.set_log_level("DEBUG")
+        isolated_logging_config.set_log_level("DEBUG")
 
         # Verify level was updated
         assert root_logger.level == logging.DEBUG
@@ -167,14 +121,12 @@ class TestSetLogLevel:
 class TestLoggingState:
     """Test the _LoggingState class."""
 
-    def test_state_class_exists(self):
+    def test_state_class_exists(self, logging_config):
         """Should have _LoggingState class for configuration state."""
-        logging_config = load_logging_config()
         assert hasattr(logging_config, "_LoggingState")
 
-    def test_state_has_handler_configured_attribute(self):
+    def test_state_has_handler_configured_attribute(self, logging_config):
         """State should have handler_configured attribute."""
-        logging_config = load_logging_config()
         state = logging_config._LoggingState()
         assert hasattr(state, "handler_configured")
         assert state.handler_configured is False
@@ -183,47 +135,35 @@ class TestLoggingState:
 class TestConfigureLogging:
     """Test the configure_logging function."""
 
-    def test_accepts_custom_log_level(self):
-        """Should accept custom log level parameter."""
-        logging_config = load_logging_config()
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"log_level": "DEBUG"}, {"max_log_size_mb": 10.0}, {"backup_count": 5}],
+        ids=["log_level", "max_log_size_mb", "backup_count"],
+    )
+    def test_accepts_custom_settings(self, isolated_logging_config, kwargs):
+        """Should accept each custom configuration parameter."""
         # This should not raise an error
-        logging_config.configure_logging(log_level="DEBUG")
-
-    def test_accepts_custom_max_size(self):
-        """Should accept custom max log size parameter."""
-        logging_config = load_logging_config()
-        # This should not raise an error
-        logging_config.configure_logging(max_log_size_mb=10.0)
-
-    def test_accepts_custom_backup_count(self):
-        """Should accept custom backup count parameter."""
-        logging_config = load_logging_config()
-        # This should not raise an error
-        logging_config.configure_logging(backup_count=5)
+        isolated_logging_config.configure_logging(**kwargs)
 
 
 class TestLoggingReconfiguration:
     """Test that logging can be reconfigured after initial setup."""
 
-    def test_reconfigure_updates_log_level(self):
+    def test_reconfigure_updates_log_level(self, isolated_logging_config):
         """Subsequent configure_logging calls should update log level."""
-        logging_config = load_logging_config()
-
         # Initial configuration
-        logging_config.configure_logging(log_level="ERROR")
+        isolated_logging_config.configure_logging(log_level="ERROR")
         root_logger = logging.getLogger("edge_tts_generate")
         assert root_logger.level == logging.ERROR
 
         # Reconfigure with different level
-        logging_config.configure_logging(log_level="DEBUG")
+        isolated_logging_config.configure_logging(log_level="DEBUG")
         assert root_logger.level == logging.DEBUG
 
-    def test_reconfigure_updates_handler_level(self):
+    def test_reconfigure_updates_handler_level(self, isolated_logging_config):
         """Subsequent configure_logging calls should update handler level."""
-        logging_config = load_logging_config()
-
         # Initial configuration
-        logging_config.configure_logging(log_level="ERROR")
+        isolated_logging_config.configure_logging(log_level="ERROR")
         root_logger = logging.getLogger("edge_tts_generate")
 
         # The handler should exist now
@@ -232,35 +172,31 @@ class TestLoggingReconfiguration:
             assert handler.level == logging.ERROR
 
             # Reconfigure with different level
-            logging_config.configure_logging(log_level="DEBUG")
+            isolated_logging_config.configure_logging(log_level="DEBUG")
             assert handler.level == logging.DEBUG
 
-    def test_reconfigure_when_handler_configured_flag_is_true(self):
+    def test_reconfigure_when_handler_configured_flag_is_true(self, isolated_logging_config):
         """Should allow reconfiguration even when _state.handler_configured is True."""
-        logging_config = load_logging_config()
-
         # First configure
-        logging_config.configure_logging(log_level="WARNING")
-        assert logging_config._state.handler_configured is True
+        isolated_logging_config.configure_logging(log_level="WARNING")
+        assert isolated_logging_config._state.handler_configured is True
 
         # The flag being True should not prevent level updates
-        logging_config.configure_logging(log_level="INFO")
+        isolated_logging_config.configure_logging(log_level="INFO")
         root_logger = logging.getLogger("edge_tts_generate")
         assert root_logger.level == logging.INFO
 
-    def test_reconfigure_preserves_handlers(self):
+    def test_reconfigure_preserves_handlers(self, isolated_logging_config):
         """Reconfiguration should not add duplicate handlers."""
-        logging_config = load_logging_config()
-
         # Initial configuration
-        logging_config.configure_logging(log_level="WARNING")
+        isolated_logging_config.configure_logging(log_level="WARNING")
         root_logger = logging.getLogger("edge_tts_generate")
         initial_handler_count = len(root_logger.handlers)
 
         # Reconfigure multiple times
-        logging_config.configure_logging(log_level="DEBUG")
-        logging_config.configure_logging(log_level="INFO")
-        logging_config.configure_logging(log_level="ERROR")
+        isolated_logging_config.configure_logging(log_level="DEBUG")
+        isolated_logging_config.configure_logging(log_level="INFO")
+        isolated_logging_config.configure_logging(log_level="ERROR")
 
         # Should not have added more handlers
         assert len(root_logger.handlers) == initial_handler_count
@@ -6,83 +6,47 @@ These tests verify that the add-on initializes correctly.
 
 from __future__ import annotations
 
-import os
-from unittest.mock import MagicMock
+import logging
+from types import SimpleNamespace
 
-
-_BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+import pytest
 
 
 class TestModuleStructure:
     """Test that all required modules exist and have correct structure."""
 
-    def test_bundled_tts_exists(self):
-        """bundled_tts.py should exist."""
-        path = os.path.join(_BASE_PATH, "bundled_tts.py")
-        assert os.path.isfile(path)
-
-    def test_edge_tts_gen_exists(self):
-        """edge_tts_gen.py should exist."""
-        path = os.path.join(_BASE_PATH, "edge_tts_gen.py")
-        assert os.path.isfile(path)
-
-    def test_logging_config_exists(self):
-        """logging_config.py should exist."""
-        path = os.path.join(_BASE_PATH, "logging_config.py")
-        assert os.path.isfile(path)
+    @pytest.mark.parametrize("filename", ["bundled_tts.py", "edge_tts_gen.py", "logging_config.py", "__init__.py"])
+    def test_module_file_exists(self, addon_entries, filename):
+        """Each add-on module file should exist."""
+        assert filename in addon_entries
+        assert addon_entries[filename].is_file()
 
-    def test_init_exists(self):
-        """__init__.py should exist."""
-        path = os.path.join(_BASE_PATH, "__init__.py")
-        assert os.path.isfile(path)
-
-    def test_vendor_directory_exists(self):
+    def test_vendor_directory_exists(self, addon_entries):
         """vendor directory should exist."""
-        path = os.path.join(_BASE_PATH, "vendor")
-        assert os.path.isdir(path)
+        assert "vendor" in addon_entries
+        assert addon_entries["vendor"].is_dir()
 
 
 class TestConfigFiles:
     """Test configuration files structure."""
 
-    def test_config_json_exists(self):
-        """config.json should exist."""
-        path = os.path.join(_BASE_PATH, "config.json")
-        assert os.path.isfile(path)
-
-    def test_manifest_json_exists(self):
-        """manifest.json should exist."""
-        path = os.path.join(_BASE_PATH, "manifest.json")
-        assert os.path.isfile(path)
-
-    def test_meta_json_exists(self):
-        """meta.json should exist."""
-        path = os.path.join(_BASE_PATH, "meta.json")
-        assert os.path.isfile(path)
+    @pytest.mark.parametrize("filename", ["config.json", "manifest.json", "meta.json"])
+    def test_json_file_exists(self, addon_entries, filename):
+        """Each add-on JSON file should exist."""
+        assert filename in addon_entries
+        assert addon_entries[filename].is_file()
 
-    def test_config_json_is_valid(self):
+    def test_config_json_is_valid(self, addon_config):
         """config.json should be valid JSON."""
-        import json
+        assert isinstance(addon_config, dict)
+        assert "speakers" in addon_config
 
-        path = os.path.join(_BASE_PATH, "config.json")
-        with open(path) as f:
-            config = json.load(f)
-
-        assert isinstance(config, dict)
-        assert "speakers" in config
-
-    def test_manifest_json_is_valid(self):
+    def test_manifest_json_is_valid(self, addon_manifest):
         """manifest.json should be valid JSON with required fields."""
-        import json
-
-        path = os.path.join(_BASE_PATH, "manifest.json")
-        with open(path) as f:
-            manifest = json.load(f)
-
-        assert "package" in manifest
-        assert "name" in manifest
-        assert "min_point_version" in manifest
-        assert "max_point_version" in manifest
+        assert "package" in addon_manifest
+        assert "name" in addon_manifest
+        assert "min_point_version" in addon_manifest
+        assert "max_point_version" in addon_manifest
 
 
 class TestLoggingConfigFallback:
@@ -90,7 +54,6 @@ class TestLoggingConfigFallback:
 
     def test_fallback_configure_logging(self):
         """Fallback configure_logging should work without Anki."""
-        import logging
 
         # Test the fallback implementation
         def configure_logging(log_level="WARNING"):
@@ -103,7 +66,6 @@ class TestLoggingConfigFallback:
 
     def test_fallback_get_logger(self):
         """Fallback get_logger should return a logger."""
-        import logging
 
         def get_logger(name: str) -> logging.Logger:
             return logging.getLogger(f"edge_tts_generate.{name.lstrip('.')}")
@@ -124,8 +86,8 @@ class TestHookFunctionSignatures:
             pass  # Implementation would go here
 
         # Should accept two arguments
-        mock_browser = MagicMock()
-        mock_menu = MagicMock()
+        mock_browser = SimpleNamespace()
+        mock_menu = SimpleNamespace()
 
         # Should not raise
         on_browser_will_show_context_menu(mock_browser, mock_menu)
@@ -136,7 +98,7 @@ class TestHookFunctionSignatures:
         def on_browser_menus_did_init(browser):
             pass  # Implementation would go here
 
-        mock_browser = MagicMock()
+        mock_browser = SimpleNamespace()
 
         # Should not raise
         on_browser_menus_did_init(mock_browser)
@@ -145,105 +107,55 @@ class TestHookFunctionSignatures:
 class TestMenuActionConfiguration:
     """Test menu action configuration by verifying __init__.py source code."""
 
-    def test_edit_menu_shortcut_in_source(self):
-        """Edit menu action shortcut should be defined in __init__.py."""
-        init_path = os.path.join(_BASE_PATH, "__init__.py")
-        with open(init_path) as f:
-            source = f.read()
-
-        # Verify the shortcut is defined in the source
-        assert "Ctrl+Shift+E" in source
-
-    def test_batch_menu_shortcut_in_source(self):
-        """Batch menu action shortcut should be defined in __init__.py."""
-        init_path = os.path.join(_BASE_PATH, "__init__.py")
-        with open(init_path) as f:
-            source = f.read()
-
-        # Verify the shortcut is defined in the source
-        assert "Ctrl+Shift+G" in source
-
-    def test_menu_action_text_in_source(self):
-        """Menu action text should be defined in __init__.py."""
-        init_path = os.path.join(_BASE_PATH, "__init__.py")
-        with open(init_path) as f:
-            source = f.read()
-
-        assert "Generate edge-tts Audio" in source
-
-    def test_batch_menu_name_in_source(self):
-        """Batch menu name should be defined in __init__.py."""
-        init_path = os.path.join(_BASE_PATH, "__init__.py")
-        with open(init_path) as f:
-            source = f.read()
-
-        assert "Generate Batch Audio" in source
+    @pytest.mark.parametrize(
+        "token",
+        ["Ctrl+Shift+E", "Ctrl+Shift+G", "Generate edge-tts Audio", "Generate Batch Audio"],
+        ids=["edit_shortcut", "batch_shortcut", "edit_text", "batch_text"],
+    )
+    def test_menu_token_in_source(self, init_source, token):
+        """Each menu action shortcut and label should be defined in __init__.py."""
+        assert token in init_source
 
 
 class TestVendorPackages:
     """Test vendored packages structure."""
 
-    def test_edge_tts_vendored(self):
-        """edge_tts should be in vendor directory."""
-        path = os.path.join(_BASE_PATH, "vendor", "edge_tts")
-        assert os.path.isdir(path)
-
-    def test_aiohttp_vendored(self):
-        """aiohttp should be in vendor directory."""
-        path = os.path.join(_BASE_PATH, "vendor", "aiohttp")
-        assert os.path.isdir(path)
-
-    def test_certifi_vendored(self):
-        """certifi should be in vendor directory."""
-        path = os.path.join(_BASE_PATH, "vendor", "certifi")
-        assert os.path.isdir(path)
+    @pytest.mark.parametrize("package", ["edge_tts", "aiohttp", "certifi"])
+    def test_package_vendored(self, vendor_entries, package):
+        """Each runtime dependency should be in the vendor directory."""
+        assert package in vendor_entries
+        assert vendor_entries[package].is_dir()
 
 
 class TestRequirementsFile:
     """Test requirements files."""
 
-    def test_requirements_test_exists(self):
+    def test_requirements_test_exists(self, addon_entries):
         """requirements-test.txt should exist."""
-        path = os.path.join(_BASE_PATH, "requirements-test.txt")
-        assert os.path.isfile(path)
+        assert "requirements-test.txt" in addon_entries
+        assert addon_entries["requirements-test.txt"].is_file()
 
-    def test_requirements_test_has_pytest(self):
+    def test_requirements_test_has_pytest(self, requirements_test_text):
         """requirements-test.txt should include pytest."""
-        path = os.path.join(_BASE_PATH, "requirements-test.txt")
-        with open(path) as f:
-            content = f.read()
-
-        assert "pytest" in content.lower()
+        assert "pytest" in requirements_test_text.lower()
 
-    def test_requirements_test_has_ruff(self):
+    def test_requirements_test_has_ruff(self, requirements_test_text):
         """requirements-test.txt should include ruff."""
-        path = os.path.join(_BASE_PATH, "requirements-test.txt")
-        with open(path) as f:
-            content = f.read()
-
-        assert "ruff" in content.lower()
+        assert "ruff" in requirements_test_text.lower()
 
 
 class TestPyprojectToml:
     """Test pyproject.toml configuration."""
 
-    def test_pyproject_exists(self):
+    def test_pyproject_exists(self, addon_entries):
         """pyproject.toml should exist."""
-        path = os.path.join(_BASE_PATH, "pyproject.toml")
-        assert os.path.isfile(path)
+        assert "pyproject.toml" in addon_entries
+        assert addon_entries["pyproject.toml"].is_file()
 
-    def test_pyproject_has_pytest_config(self):
+    def test_pyproject_has_pytest_config(self, pyproject_text):
         """pyproject.toml should have pytest configuration."""
-        path = os.path.join(_BASE_PATH, "pyproject.toml")
-        with open(path) as f:
-            content = f.read()
+        assert "[tool.pytest" in pyproject_text
 
-        assert "[tool.pytest" in content
-
-    def test_pyproject_has_ruff_config(self):
+    def test_pyproject_has_ruff_config(self, pyproject_text):
         """pyproject.toml should have ruff configuration."""
-        path = os.path.join(_BASE_PATH, "pyproject.toml")
-        with open(path) as f:
-            content = f.read()
-
-        assert "[tool.ruff" in content
+        assert "[tool.ruff" in pyproject_text
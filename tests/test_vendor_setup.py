@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib
+import os
 import sys
 
 import vendor_setup
@@ -17,6 +18,66 @@ def test_ensure_vendor_path_adds_directory(monkeypatch):
     assert sys.path[0] == vendor_dir
 
 
+class _RecordingPath(list):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.calls = []
+
+    def __contains__(self, item):
+        self.calls.append(("contains", item))
+        return super().__contains__(item)
+
+    def insert(self, index, item):
+        self.calls.append(("insert", item))
+        super().insert(index, item)
+
+
+def test_ensure_vendor_path_repeat_call_takes_fast_path(monkeypatch):
+    vendor_dir = vendor_setup.ensure_vendor_path()
+    path = _RecordingPath([vendor_dir, *(p for p in sys.path if p != vendor_dir)])
+    monkeypatch.setattr(sys, "path", path)
+
+    assert vendor_setup.ensure_vendor_path() == vendor_dir
+    # Returning before the membership scan means sys.path is neither searched nor modified
+    assert path.calls == []
+
+
+def test_ensure_vendor_path_reinserts_displaced_directory_without_touching_env(monkeypatch):
+    vendor_dir = vendor_setup.ensure_vendor_path()
+    monkeypatch.setattr(sys, "path", ["/elsewhere", *(p for p in sys.path if p != vendor_dir)])
+    monkeypatch.setattr(os, "environ", {})
+
+    assert vendor_setup.ensure_vendor_path() == vendor_dir
+    assert sys.path[0] == vendor_dir
+    # Flags are applied only on first setup, not when the path entry is restored
+    assert os.environ == {}
+
+
+class _RecordingEnviron(dict):
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.updates = []
+
+    def update(self, *args, **kwargs):
+        self.updates.append(dict(*args, **kwargs))
+        super().update(*args, **kwargs)
+
+
+def test_first_setup_keeps_user_flags_and_adds_missing_ones_in_one_update(monkeypatch):
+    environ = _RecordingEnviron({"AIOHTTP_NO_EXTENSIONS": "0", "YARL_NO_EXTENSIONS": "0"})
+    monkeypatch.setattr(os, "environ", environ)
+    monkeypatch.setattr(vendor_setup._state, "configured", False)
+
+    vendor_setup.ensure_vendor_path()
+
+    assert environ["AIOHTTP_NO_EXTENSIONS"] == "0"
+    assert environ["YARL_NO_EXTENSIONS"] == "0"
+    assert environ.updates == [
+        {"FROZENLIST_NO_EXTENSIONS": "1", "MULTIDICT_NO_EXTENSIONS": "1", "PROPCACHE_NO_EXTENSIONS": "1"}
+    ]
+    assert vendor_setup._state.configured is True
+
+
 def test_bundled_tts_imports_edge_tts(monkeypatch):
     vendor_dir = vendor_setup.ensure_vendor_path()
 
@@ -5,6 +5,8 @@ import sys
 from os.path import abspath, dirname, join
 
 
+_VENDOR_DIR = abspath(join(dirname(__file__), "vendor"))
+
 _ENVIRONMENT_FLAGS = {
     "AIOHTTP_NO_EXTENSIONS": "1",
     "FROZENLIST_NO_EXTENSIONS": "1",
@@ -14,14 +16,31 @@ _ENVIRONMENT_FLAGS = {
 }
 
 
+class _VendorState:
+    """Container for vendor setup state."""
+
+    configured: bool = False
+
+
+_state = _VendorState()
+
+
 def ensure_vendor_path() -> str:
     """Ensure the vendored dependencies are importable and configured."""
 
-    vendor_dir = abspath(join(dirname(__file__), "vendor"))
-    if vendor_dir not in sys.path:
-        sys.path.insert(0, vendor_dir)
+    # Fast path: setup already ran and the vendor directory is still first on sys.path
+    if _state.configured and sys.path[:1] == [_VENDOR_DIR]:
+        return _VENDOR_DIR
+
+    if _VENDOR_DIR not in sys.path:
+        sys.path.insert(0, _VENDOR_DIR)
 
-    for key, value in _ENVIRONMENT_FLAGS.items():
-        os.environ.setdefault(key, value)
+    # The flags only matter before the vendored packages are first imported
+    if not _state.configured:
+        # Never override a flag the user has already set
+        missing = {key: value for key, value in _ENVIRONMENT_FLAGS.items() if key not in os.environ}
+        if missing:
+            os.environ.update(missing)
+        _state.configured = True
 
-    return vendor_dir
+    return _VENDOR_DIR